@@ -7,15 +7,26 @@ identifying different categories of artifacts:
 - Kernel databases (library-specific kernel collections)
 """
 
+import functools
+import os
 import subprocess
+import threading
 from abc import ABC, abstractmethod
 from concurrent.futures import Executor, as_completed
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Iterator
 
 from rocm_kpack.binutils import BundledBinary, Toolchain
 
+# Whether the tree can be walked through directory descriptors (POSIX)
+_HAVE_DIR_FDS = (
+    hasattr(os, "O_DIRECTORY")
+    and os.scandir in os.supports_fd
+    and os.open in os.supports_dir_fd
+)
+_DIR_OPEN_FLAGS = os.O_RDONLY | getattr(os, "O_DIRECTORY", 0)
+
 
 @dataclass(frozen=True)
 class ArtifactPath:
@@ -28,30 +39,56 @@ class ArtifactPath:
     Attributes:
         root_dir: The root directory being scanned
         relative_path: Path relative to root_dir
+        dir_entry: Directory entry from the scan, if available. Its cached
+            file type lets is_dir()/is_file() answer without a stat call.
+        parent_dir_fd: Open descriptor for the parent directory, if available.
+            Only valid while the path is being processed by a sequential scan;
+            lets recognizers probe children with a short relative lookup.
     """
 
     root_dir: Path
     relative_path: Path
+    dir_entry: os.DirEntry | None = field(default=None, compare=False, repr=False)
+    parent_dir_fd: int | None = field(default=None, compare=False, repr=False)
 
-    @property
+    @functools.cached_property
     def absolute_path(self) -> Path:
-        """Compute the absolute path by joining root_dir and relative_path."""
+        """Compute the absolute path by joining root_dir and relative_path.
+
+        Cached, since the scanner, recognizers and visitors each consult it
+        several times per path.
+        """
         return self.root_dir / self.relative_path
 
+    def is_dir(self) -> bool:
+        """Whether the path is a directory (following symlinks)."""
+        if self.dir_entry is not None:
+            return self.dir_entry.is_dir()
+        return self.absolute_path.is_dir()
 
+    def is_file(self) -> bool:
+        """Whether the path is a regular file (following symlinks)."""
+        if self.dir_entry is not None:
+            return self.dir_entry.is_file()
+        return self.absolute_path.is_file()
+
+
+@dataclass(frozen=True, slots=True)
 class KernelArtifact:
     """Represents a single kernel artifact within a database.
 
+    One instance exists per kernel file, so it uses slots to avoid a
+    per-instance __dict__.
+
     Attributes:
         relative_path: Path relative to the database root
         gfx_target: GPU architecture (e.g., 'gfx1100', 'gfx1201')
         artifact_type: Type of artifact ('code_object', 'metadata', 'hsaco', etc.)
     """
 
-    def __init__(self, relative_path: Path, gfx_target: str, artifact_type: str):
-        self.relative_path = relative_path
-        self.gfx_target = gfx_target
-        self.artifact_type = artifact_type
+    relative_path: Path
+    gfx_target: str
+    artifact_type: str
 
     def __repr__(self):
         return (
@@ -229,8 +266,13 @@ class ArtifactScanner:
         self.registry = recognizer_registry
         self.toolchain = toolchain
         self.executor = executor
-        # Track relative paths of visited databases to avoid double-visiting
-        self._visited_database_paths: set[Path] = set()
+        # Relative paths of visited databases, each with a trailing separator,
+        # to avoid double-visiting their contents. Kept as strings so the check
+        # for every scanned path is a single str.startswith call. Readers use
+        # whatever tuple is current; updates are serialized by the lock since
+        # paths may be processed on executor threads.
+        self._visited_database_prefixes: tuple[str, ...] = ()
+        self._visited_lock = threading.Lock()
 
     def scan_tree(self, root_dir: Path, visitor: ArtifactVisitor) -> None:
         """Walk the tree and invoke visitor callbacks.
@@ -246,17 +288,19 @@ class ArtifactScanner:
             visitor: Visitor to receive callbacks (must be thread-safe if using executor)
         """
         if self.executor is None:
-            # Sequential processing: process as we walk
-            for abs_path in self._walk_tree(root_dir):
-                relative_path = abs_path.relative_to(root_dir)
-                artifact_path = ArtifactPath(root_dir, relative_path)
+            # Sequential processing: process as we walk. Each path is handled
+            # while the walk holds its parent directory open, so the
+            # descriptor can be handed to recognizers.
+            for relative_path, entry, parent_fd in self._walk_tree(
+                root_dir, use_dir_fds=_HAVE_DIR_FDS
+            ):
+                artifact_path = ArtifactPath(root_dir, relative_path, entry, parent_fd)
                 self._process_path(artifact_path, visitor)
         else:
             # Parallel processing: submit to executor as we walk
             futures = []
-            for abs_path in self._walk_tree(root_dir):
-                relative_path = abs_path.relative_to(root_dir)
-                artifact_path = ArtifactPath(root_dir, relative_path)
+            for relative_path, entry, _ in self._walk_tree(root_dir):
+                artifact_path = ArtifactPath(root_dir, relative_path, entry)
                 future = self.executor.submit(
                     self._process_path, artifact_path, visitor
                 )
@@ -266,18 +310,60 @@ class ArtifactScanner:
             for future in as_completed(futures):
                 future.result()  # Propagate exceptions
 
-    def _walk_tree(self, root_dir: Path) -> Iterator[Path]:
+    def _walk_tree(
+        self, root_dir: Path, use_dir_fds: bool = False
+    ) -> Iterator[tuple[Path, os.DirEntry, int | None]]:
         """Walk the directory tree, yielding all paths.
 
+        Each directory is listed with os.scandir, so the yielded entries carry
+        their file type and later type checks need no extra stat calls.
+        Symlinked directories are yielded but not descended into.
+
+        With use_dir_fds, each directory is opened once relative to its
+        parent's descriptor and listed through that descriptor, so the kernel
+        never re-resolves the full path. The descriptor is only open until the
+        walk moves past the directory, and the entries' path attribute is then
+        just the file name.
+
         Args:
             root_dir: Root directory to walk
+            use_dir_fds: Walk via directory descriptors
 
         Yields:
-            Absolute paths to all files and directories
+            (relative_path, dir_entry, parent_dir_fd) for all files and
+            directories; parent_dir_fd is None unless use_dir_fds is set
         """
-        # Use sorted for deterministic ordering in tests
-        for path in sorted(root_dir.rglob("*")):
-            yield path
+
+        def walk(
+            dir_path: str | int, rel_dir: Path
+        ) -> Iterator[tuple[Path, os.DirEntry, int | None]]:
+            # Sort siblings for deterministic ordering in tests; yielding each
+            # directory before its contents gives the same order as sorting
+            # the full list of paths
+            with os.scandir(dir_path) as it:
+                entries = sorted(it, key=lambda e: e.name)
+            dir_fd = dir_path if use_dir_fds else None
+            for entry in entries:
+                rel_path = rel_dir / entry.name
+                yield rel_path, entry, dir_fd
+                if entry.is_dir(follow_symlinks=False):
+                    if dir_fd is None:
+                        yield from walk(entry.path, rel_path)
+                    else:
+                        child_fd = os.open(entry.name, _DIR_OPEN_FLAGS, dir_fd=dir_fd)
+                        try:
+                            yield from walk(child_fd, rel_path)
+                        finally:
+                            os.close(child_fd)
+
+        if not use_dir_fds:
+            yield from walk(os.fspath(root_dir), Path())
+            return
+        root_fd = os.open(root_dir, _DIR_OPEN_FLAGS)
+        try:
+            yield from walk(root_fd, Path())
+        finally:
+            os.close(root_fd)
 
     def _process_path(
         self, artifact_path: ArtifactPath, visitor: ArtifactVisitor
@@ -289,23 +375,25 @@ class ArtifactScanner:
             visitor: Visitor to invoke
         """
         # Skip if already visited as part of a database
-        if any(
-            artifact_path.relative_path.is_relative_to(db_rel_path)
-            for db_rel_path in self._visited_database_paths
+        if os.fspath(artifact_path.relative_path).startswith(
+            self._visited_database_prefixes
         ):
             return
 
         # Try database recognition (directories only)
-        if artifact_path.absolute_path.is_dir():
+        if artifact_path.is_dir():
             database = self.registry.try_recognize(artifact_path)
             if database:
                 visitor.visit_kernel_database(artifact_path, database)
-                self._visited_database_paths.add(artifact_path.relative_path)
+                with self._visited_lock:
+                    self._visited_database_prefixes += (
+                        os.path.join(artifact_path.relative_path, ""),
+                    )
                 return
 
         # Try bundled binary detection
         if (
-            artifact_path.absolute_path.is_file()
+            artifact_path.is_file()
             and self.toolchain
             and self._is_bundled_binary(artifact_path)
         ):
@@ -314,7 +402,7 @@ class ArtifactScanner:
             return
 
         # Default: opaque file
-        if artifact_path.absolute_path.is_file():
+        if artifact_path.is_file():
             visitor.visit_opaque_file(artifact_path)
 
     def _is_bundled_binary(self, artifact_path: ArtifactPath) -> bool:
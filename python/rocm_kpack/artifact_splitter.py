@@ -8,15 +8,20 @@ This module provides functionality to split TheRock build artifacts into:
 - Architecture-specific artifacts: Device code (kpack files and kernel databases)
 """
 
+import fnmatch
+import io
 import os
-import shutil
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Tuple, Dict, Optional, Set
+from typing import Iterable, List, Tuple, Dict, Optional, Set
 from collections import defaultdict
 from dataclasses import dataclass
 import msgpack
 
 from rocm_kpack.artifact_utils import (
+    copy_file,
     extract_architecture_from_target,
     is_fat_binary,
     read_artifact_manifest,
@@ -28,11 +33,35 @@ from rocm_kpack.database_handlers import DatabaseHandler
 from rocm_kpack.kpack import PackedKernelArchive
 from rocm_kpack.compression import ZstdCompressor
 from rocm_kpack.elf_offload_kpacker import kpack_offload_binary
+from rocm_kpack.parallel import get_worker_count
 
 
-@dataclass
+# Per-thread output buffer, set while a prefix is processed on a worker thread
+_prefix_output = threading.local()
+_print_lock = threading.Lock()
+
+
+def _log(message: str = "") -> None:
+    """Print a progress message, buffering it if the prefix runs in parallel."""
+    buffer = getattr(_prefix_output, "buffer", None)
+    if buffer is None:
+        print(message)
+    else:
+        buffer.write(message + "\n")
+
+
+def _compile_path_patterns(patterns: Tuple[str, ...]) -> re.Pattern:
+    """Compile fnmatch patterns into a single regex matching any of them."""
+    return re.compile("|".join(fnmatch.translate(p) for p in patterns))
+
+
+@dataclass(frozen=True, slots=True)
 class ExtractedKernel:
-    """Represents a kernel extracted from a fat binary."""
+    """Represents a kernel extracted from a fat binary.
+
+    One instance exists per kernel per architecture, so it uses slots to
+    avoid a per-instance __dict__.
+    """
 
     target_name: str  # Target identifier from bundler (e.g., "hip-amdgcn-amd-amdhsa-gfx1100")
     kernel_data: bytes  # The actual kernel binary data
@@ -78,6 +107,16 @@ class FileClassificationVisitor:
         ] = defaultdict(list)
         self.exclude_from_generic: Set[Path] = set()
 
+        # Each handler's path patterns compiled into one regex, plus a union
+        # of all of them, so most files are ruled out with a single match
+        self._handler_patterns = [
+            (_compile_path_patterns(handler.path_patterns()), handler)
+            for handler in self.database_handlers
+        ]
+        self._database_path_filter = _compile_path_patterns(
+            tuple(p for h in self.database_handlers for p in h.path_patterns())
+        )
+
     def visit_file(self, file_path: Path, prefix_path: Path) -> None:
         """
         Visit a file and classify it.
@@ -86,27 +125,97 @@ class FileClassificationVisitor:
             file_path: Path to the file
             prefix_path: Root of the prefix for relative path computation
         """
-        if not file_path.is_file():
+        self._record(file_path, prefix_path, self._classify(file_path, prefix_path))
+
+    def visit_files(
+        self,
+        file_paths: Iterable[Path],
+        prefix_path: Path,
+        max_workers: Optional[int] = None,
+    ) -> None:
+        """
+        Classify many files concurrently.
+
+        Classification reads each file independently, so the reads are
+        spread over a thread pool. Results are recorded in the order the
+        files were given, exactly as repeated visit_file calls would.
+
+        Args:
+            file_paths: Paths to the files
+            prefix_path: Root of the prefix for relative path computation
+            max_workers: Maximum number of concurrent classifications
+                (None = use all CPU cores)
+        """
+        file_paths = list(file_paths)
+        workers = min(get_worker_count(max_workers), len(file_paths))
+        if workers <= 1:
+            for file_path in file_paths:
+                self.visit_file(file_path, prefix_path)
             return
 
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(
+                lambda file_path: self._classify(file_path, prefix_path), file_paths
+            )
+            for file_path, result in zip(file_paths, results):
+                self._record(file_path, prefix_path, result)
+
+    def _classify(
+        self, file_path: Path, prefix_path: Path
+    ) -> Optional[Tuple[Optional[str], Optional[DatabaseHandler]]]:
+        """
+        Classify a file without recording the result.
+
+        Returns:
+            (None, None) for a fat binary, (arch, handler) for a database
+            file, or None if the file needs no special handling
+        """
+        if not file_path.is_file():
+            return None
+
         # Check if it's a fat binary
         if is_fat_binary(file_path, self.toolchain):
+            return None, None
+
+        # Check database handlers whose path patterns match
+        if not self.database_handlers:
+            return None
+        try:
+            rel_path = file_path.relative_to(prefix_path).as_posix()
+        except ValueError:
+            return None  # Outside the prefix; no handler detects these
+        if not self._database_path_filter.match(rel_path):
+            return None
+        for pattern, handler in self._handler_patterns:
+            if not pattern.match(rel_path):
+                continue
+            arch = handler.detect(file_path, prefix_path)
+            if arch:
+                return arch, handler  # First matching handler wins
+        return None
+
+    def _record(
+        self,
+        file_path: Path,
+        prefix_path: Path,
+        result: Optional[Tuple[Optional[str], Optional[DatabaseHandler]]],
+    ) -> None:
+        """Accumulate a classification result from _classify."""
+        if result is None:
+            return
+        arch, handler = result
+        if handler is None:
             self.fat_binaries.append(file_path)
             if self.verbose:
-                print(f"  Found fat binary: {file_path.relative_to(prefix_path)}")
+                _log(f"  Found fat binary: {file_path.relative_to(prefix_path)}")
             return
 
-        # Check database handlers
-        for handler in self.database_handlers:
-            arch = handler.detect(file_path, prefix_path)
-            if arch:
-                self.database_files_by_arch[arch].append((file_path, handler))
-                self.exclude_from_generic.add(file_path)
-                if self.verbose:
-                    print(
-                        f"  Found {handler.name()} database file for {arch}: {file_path.relative_to(prefix_path)}"
-                    )
-                break  # First matching handler wins
+        self.database_files_by_arch[arch].append((file_path, handler))
+        self.exclude_from_generic.add(file_path)
+        if self.verbose:
+            _log(
+                f"  Found {handler.name()} database file for {arch}: {file_path.relative_to(prefix_path)}"
+            )
 
     def get_statistics(self) -> str:
         """Get a summary of classification results."""
@@ -145,19 +254,25 @@ class GenericCopyVisitor:
         self.verbose = verbose
         self.copied_count = 0
         self.excluded_count = 0
+        # Destination directories already created, so each is made only once
+        self._created_dirs: Set[Path] = set()
 
-    def visit_file(self, file_path: Path) -> None:
+    def visit_file(
+        self, file_path: Path, direntry: Optional[os.DirEntry] = None
+    ) -> None:
         """
         Visit a file and copy it if not excluded.
 
         Args:
             file_path: Path to the file
+            direntry: Directory entry for the file from the scan, if available;
+                its cached type avoids an lstat per file
         """
         if file_path in self.exclude_files:
             self.excluded_count += 1
             if self.verbose:
                 rel_path = file_path.relative_to(self.source_prefix)
-                print(f"    Excluding: {rel_path}")
+                _log(f"    Excluding: {rel_path}")
             return
 
         # Copy the file preserving structure
@@ -165,18 +280,25 @@ class GenericCopyVisitor:
         dest_path = self.dest_prefix / rel_path
 
         # Create parent directories
-        dest_path.parent.mkdir(parents=True, exist_ok=True)
+        if dest_path.parent not in self._created_dirs:
+            dest_path.parent.mkdir(parents=True, exist_ok=True)
+            self._created_dirs.add(dest_path.parent)
 
         # Handle symlinks vs regular files
-        if file_path.is_symlink():
-            # Preserve symlink (don't follow)
+        is_symlink = (
+            direntry.is_symlink() if direntry is not None else file_path.is_symlink()
+        )
+        if is_symlink:
+            # Preserve symlink (don't follow), replacing any existing entry
             link_target = os.readlink(file_path)
-            if dest_path.exists() or dest_path.is_symlink():
-                dest_path.unlink()
-            os.symlink(link_target, dest_path)
+            try:
+                os.symlink(link_target, dest_path)
+            except FileExistsError:
+                os.unlink(dest_path)
+                os.symlink(link_target, dest_path)
         else:
             # Copy regular file
-            shutil.copy2(file_path, dest_path)
+            copy_file(file_path, dest_path)
         self.copied_count += 1
 
     def get_statistics(self) -> str:
@@ -195,6 +317,8 @@ class ArtifactSplitter:
         toolchain: Toolchain,
         database_handlers: Optional[List[DatabaseHandler]] = None,
         verbose: bool = False,
+        max_workers: Optional[int] = None,
+        architectures: Optional[Iterable[str]] = None,
     ):
         """
         Initialize the artifact splitter.
@@ -204,11 +328,24 @@ class ArtifactSplitter:
             toolchain: Toolchain instance for binary operations
             database_handlers: Optional list of DatabaseHandler instances for kernel databases
             verbose: Enable verbose output
+            max_workers: Maximum number of concurrent workers for a split,
+                used for prefixes when there are several and for a single
+                prefix's file classification otherwise (None = use all CPU
+                cores)
+            architectures: Only extract kernels for these architectures (e.g.
+                'gfx1100', 'gfx942:xnack+'); kernels for any other architecture
+                are not unbundled and are dropped from the split. Database
+                files are not affected. None extracts every architecture.
         """
         self.artifact_prefix = artifact_prefix
         self.toolchain = toolchain
         self.database_handlers = database_handlers or []
         self.verbose = verbose
+        self.max_workers = max_workers
+        self.architectures = (
+            frozenset(architectures) if architectures is not None else None
+        )
+        self._manifest_lock = threading.Lock()
 
     def compute_manifest_relative_path(
         self, binary_path: Path, prefix_root: Path
@@ -245,7 +382,10 @@ class ArtifactSplitter:
         return manifest_path
 
     def scan_prefix(
-        self, prefix_path: Path, visitor: FileClassificationVisitor
+        self,
+        prefix_path: Path,
+        visitor: FileClassificationVisitor,
+        max_workers: Optional[int] = None,
     ) -> None:
         """
         Scan a prefix directory and classify files using the visitor.
@@ -253,17 +393,26 @@ class ArtifactSplitter:
         Args:
             prefix_path: Path to the prefix directory
             visitor: Visitor to accumulate classification results
+            max_workers: Maximum number of concurrent classifications
+                (None = the splitter's max_workers)
         """
         if self.verbose:
-            print(f"Scanning prefix: {prefix_path}")
-
-        # Walk through all files in the prefix using robust directory traversal
-        for file_path, direntry in scan_directory(prefix_path):
-            if direntry.is_file(follow_symlinks=False):
-                visitor.visit_file(file_path, prefix_path)
+            _log(f"Scanning prefix: {prefix_path}")
+
+        # Walk through all files in the prefix using robust directory traversal,
+        # then classify them concurrently
+        visitor.visit_files(
+            (
+                file_path
+                for file_path, direntry in scan_directory(prefix_path)
+                if direntry.is_file(follow_symlinks=False)
+            ),
+            prefix_path,
+            max_workers=self.max_workers if max_workers is None else max_workers,
+        )
 
         if self.verbose:
-            print(visitor.get_statistics())
+            _log(visitor.get_statistics())
 
     def copy_generic_artifact(
         self, prefix_path: Path, dest_prefix: Path, exclude_files: Set[Path]
@@ -277,7 +426,7 @@ class ArtifactSplitter:
             exclude_files: Set of files to exclude from copying
         """
         if self.verbose:
-            print(f"  Creating generic artifact (excluding {len(exclude_files)} files)")
+            _log(f"  Creating generic artifact (excluding {len(exclude_files)} files)")
 
         copy_visitor = GenericCopyVisitor(
             exclude_files, prefix_path, dest_prefix, self.verbose
@@ -287,10 +436,16 @@ class ArtifactSplitter:
         for file_path, direntry in scan_directory(prefix_path):
             # Handle both regular files and symlinks
             if direntry.is_file(follow_symlinks=False) or direntry.is_symlink():
-                copy_visitor.visit_file(file_path)
+                copy_visitor.visit_file(file_path, direntry)
 
         if self.verbose:
-            print(copy_visitor.get_statistics())
+            _log(copy_visitor.get_statistics())
+
+    def _wants_target(self, target_name: str) -> bool:
+        """Whether kernels for a bundle target should be extracted."""
+        if self.architectures is None:
+            return True
+        return extract_architecture_from_target(target_name) in self.architectures
 
     def process_fat_binaries(
         self, fat_binaries: List[Path], prefix: str, prefix_path: Path
@@ -310,13 +465,14 @@ class ArtifactSplitter:
 
         for binary_path in fat_binaries:
             if self.verbose:
-                print(f"Processing fat binary: {binary_path.relative_to(prefix_path)}")
+                _log(f"Processing fat binary: {binary_path.relative_to(prefix_path)}")
 
             # Create a BundledBinary instance with our toolchain
             binary = BundledBinary(binary_path, toolchain=self.toolchain)
 
-            # Extract kernels using context manager
-            with binary.unbundle() as unbundled:
+            # Extract kernels using context manager, skipping the bundler work
+            # for architectures that were not requested
+            with binary.unbundle(target_filter=self._wants_target) as unbundled:
                 # Process each unbundled target
                 for target_name, file_name in unbundled.target_list:
                     # Extract architecture from target name (e.g., "hip-amdgcn-amd-amdhsa-gfx1100")
@@ -339,7 +495,7 @@ class ArtifactSplitter:
 
                         kernels_by_arch[arch].append(extracted_kernel)
                         if self.verbose:
-                            print(
+                            _log(
                                 f"    Extracted kernel for {arch}: {file_name} ({len(kernel_data)} bytes)"
                             )
 
@@ -457,11 +613,10 @@ class ArtifactSplitter:
 
             # Update or create artifact manifest for this architecture artifact
             # Include all prefixes that contributed kernels
-            manifest_path = arch_artifact_dir / "artifact_manifest.txt"
-            existing_prefixes = []
-            if manifest_path.exists():
-                with open(manifest_path, "r") as f:
-                    existing_prefixes = [line.strip() for line in f if line.strip()]
+            try:
+                existing_prefixes = read_artifact_manifest(arch_artifact_dir)
+            except FileNotFoundError:
+                existing_prefixes = []
 
             # Add all prefixes that had kernels
             for prefix in kernels_by_prefix.keys():
@@ -489,6 +644,9 @@ class ArtifactSplitter:
         if self.verbose:
             print("\nInjecting kpack manifest references and stripping device code")
 
+        # One packer serializes every prefix's manifest
+        packer = msgpack.Packer(use_bin_type=True)
+
         for prefix, binary_paths in fat_binaries_by_prefix.items():
             prefix_dir = generic_artifact_dir / prefix
 
@@ -522,7 +680,7 @@ class ArtifactSplitter:
 
             # Write the manifest
             with open(manifest_path, "wb") as f:
-                msgpack.pack(manifest_data, f)
+                f.write(packer.pack(manifest_data))
 
             # Validate manifest was created
             if not manifest_path.exists():
@@ -618,34 +776,137 @@ class ArtifactSplitter:
             arch_prefix_dir = arch_artifact_dir / prefix
 
             if self.verbose:
-                print(
+                _log(
                     f"  Moving {len(file_handler_pairs)} database files to {arch_artifact_name}"
                 )
 
+            created_dirs: Set[Path] = set()
             for file_path, handler in file_handler_pairs:
                 # Compute destination path preserving structure
                 rel_path = file_path.relative_to(prefix_path)
                 dest_path = arch_prefix_dir / rel_path
 
-                # Create parent directories
-                dest_path.parent.mkdir(parents=True, exist_ok=True)
+                # Create parent directories (once per directory)
+                if dest_path.parent not in created_dirs:
+                    dest_path.parent.mkdir(parents=True, exist_ok=True)
+                    created_dirs.add(dest_path.parent)
 
                 # Copy the file (will move after generic is created)
                 if self.verbose:
-                    print(f"    Moving: {rel_path}")
-                shutil.copy2(file_path, dest_path)
+                    _log(f"    Moving: {rel_path}")
+                copy_file(file_path, dest_path)
 
-            # Update or create artifact manifest for this architecture artifact
-            manifest_path = arch_artifact_dir / "artifact_manifest.txt"
-            existing_prefixes = []
-            if manifest_path.exists():
-                with open(manifest_path, "r") as f:
-                    existing_prefixes = [line.strip() for line in f if line.strip()]
+            # Update or create artifact manifest for this architecture artifact.
+            # Prefixes are processed concurrently, so the read-modify-write of
+            # the shared manifest is serialized.
+            with self._manifest_lock:
+                try:
+                    existing_prefixes = read_artifact_manifest(arch_artifact_dir)
+                except FileNotFoundError:
+                    existing_prefixes = []
 
-            # Add current prefix if not already present
-            if prefix not in existing_prefixes:
-                existing_prefixes.append(prefix)
-                write_artifact_manifest(arch_artifact_dir, existing_prefixes)
+                # Add current prefix if not already present
+                if prefix not in existing_prefixes:
+                    existing_prefixes.append(prefix)
+                    write_artifact_manifest(arch_artifact_dir, existing_prefixes)
+
+    def _process_prefix(
+        self,
+        prefix: str,
+        input_dir: Path,
+        output_dir: Path,
+        classify_workers: Optional[int] = None,
+    ) -> Optional[Tuple[Dict[str, List[ExtractedKernel]], List[Path]]]:
+        """
+        Classify, copy and extract kernels for a single prefix.
+
+        Args:
+            prefix: The prefix string (from artifact_manifest.txt)
+            input_dir: Input artifact directory
+            output_dir: Output directory for split artifacts
+            classify_workers: Maximum number of concurrent file classifications
+                (None = the splitter's max_workers)
+
+        Returns:
+            Tuple of (kernels by architecture, fat binaries copied to the
+            generic artifact), or None if the prefix directory does not exist
+        """
+        prefix_path = input_dir / prefix
+
+        if not prefix_path.exists():
+            # Skip empty prefixes (directories that had no files may not be created in artifact)
+            if self.verbose:
+                _log(f"\nSkipping prefix (directory does not exist): {prefix}")
+            return None
+
+        if self.verbose:
+            _log(f"\nProcessing prefix: {prefix}")
+
+        # Phase 1: Classify files using visitor
+        classifier = FileClassificationVisitor(
+            self.toolchain, self.database_handlers, self.verbose
+        )
+        self.scan_prefix(prefix_path, classifier, max_workers=classify_workers)
+
+        # Phase 2: Process database files (move to arch-specific artifacts)
+        if self.database_handlers and classifier.database_files_by_arch:
+            self.process_database_files(
+                classifier.database_files_by_arch, prefix, prefix_path, output_dir
+            )
+
+        # Phase 3: Create generic artifact (excluding database files)
+        generic_artifact_name = f"{self.artifact_prefix}_generic"
+        generic_artifact_dir = output_dir / generic_artifact_name
+        generic_prefix_dir = generic_artifact_dir / prefix
+
+        if self.verbose:
+            _log(f"Creating generic artifact: {generic_artifact_name}")
+
+        # Copy files excluding those marked for exclusion
+        self.copy_generic_artifact(
+            prefix_path, generic_prefix_dir, classifier.exclude_from_generic
+        )
+
+        # Phase 4: Process fat binaries and extract kernels
+        kernels_by_arch: Dict[str, List[ExtractedKernel]] = {}
+        fat_binaries_in_generic: List[Path] = []
+        if classifier.fat_binaries:
+            kernels_by_arch = self.process_fat_binaries(
+                classifier.fat_binaries, prefix, prefix_path
+            )
+
+            # Track fat binaries in the generic artifact for later processing
+            for binary_path in classifier.fat_binaries:
+                generic_binary_path = generic_prefix_dir / binary_path.relative_to(
+                    prefix_path
+                )
+                if generic_binary_path.exists():
+                    fat_binaries_in_generic.append(generic_binary_path)
+
+        return kernels_by_arch, fat_binaries_in_generic
+
+    def _process_prefix_buffered(
+        self, prefix: str, input_dir: Path, output_dir: Path
+    ) -> Optional[Tuple[Dict[str, List[ExtractedKernel]], List[Path]]]:
+        """
+        Run _process_prefix on a worker thread, printing its output as a block.
+
+        Prefixes processed concurrently would otherwise interleave their
+        verbose output line by line, so each prefix's messages are buffered
+        and printed together once that prefix finishes.
+        """
+        buffer = io.StringIO()
+        _prefix_output.buffer = buffer
+        try:
+            return self._process_prefix(
+                prefix, input_dir, output_dir, classify_workers=1
+            )
+        finally:
+            _prefix_output.buffer = None
+            output = buffer.getvalue()
+            if output:
+                with _print_lock:
+                    print(output, end="")
 
     def split(self, input_dir: Path, output_dir: Path):
         """
@@ -680,68 +941,43 @@ class ArtifactSplitter:
         # Track prefixes that were actually processed (for manifest)
         processed_prefixes: List[str] = []
 
-        # Process each prefix
-        for prefix in prefixes:
-            prefix_path = input_dir / prefix
-
-            if not prefix_path.exists():
-                # Skip empty prefixes (directories that had no files may not be created in artifact)
-                if self.verbose:
-                    print(f"\nSkipping prefix (directory does not exist): {prefix}")
-                continue
-
-            if self.verbose:
-                print(f"\nProcessing prefix: {prefix}")
-
-            # Phase 1: Classify files using visitor
-            classifier = FileClassificationVisitor(
-                self.toolchain, self.database_handlers, self.verbose
-            )
-            self.scan_prefix(prefix_path, classifier)
-
-            # Phase 2: Process database files (move to arch-specific artifacts)
-            if self.database_handlers and classifier.database_files_by_arch:
-                self.process_database_files(
-                    classifier.database_files_by_arch, prefix, prefix_path, output_dir
+        # Phases 1-4 are independent per prefix and dominated by file I/O and
+        # tool subprocesses, so prefixes are processed concurrently. Results
+        # are merged in manifest order to keep the output deterministic.
+        # Only one level runs in parallel so max_workers is an overall limit:
+        # with several prefixes each prefix classifies its files inline, and
+        # a lone prefix classifies its files on the pool instead.
+        prefix_workers = min(len(prefixes), get_worker_count(self.max_workers))
+        if prefix_workers > 1:
+            with ThreadPoolExecutor(max_workers=prefix_workers) as ex:
+                results = list(
+                    ex.map(
+                        lambda prefix: self._process_prefix_buffered(
+                            prefix, input_dir, output_dir
+                        ),
+                        prefixes,
+                    )
                 )
+        else:
+            results = [
+                self._process_prefix(prefix, input_dir, output_dir)
+                for prefix in prefixes
+            ]
 
-            # Phase 3: Create generic artifact (excluding database files)
-            generic_artifact_name = f"{self.artifact_prefix}_generic"
-            generic_artifact_dir = output_dir / generic_artifact_name
-            generic_prefix_dir = generic_artifact_dir / prefix
-
-            if self.verbose:
-                print(f"Creating generic artifact: {generic_artifact_name}")
-
-            # Copy files excluding those marked for exclusion
-            self.copy_generic_artifact(
-                prefix_path, generic_prefix_dir, classifier.exclude_from_generic
-            )
+        for prefix, result in zip(prefixes, results):
+            if result is None:
+                continue
+            kernels_by_arch, fat_binaries_in_generic = result
 
             # Track this prefix for the manifest
             processed_prefixes.append(prefix)
 
-            # Phase 4: Process fat binaries and accumulate kernels
-            if classifier.fat_binaries:
-                kernels_by_arch = self.process_fat_binaries(
-                    classifier.fat_binaries, prefix, prefix_path
-                )
-
-                # Accumulate kernels from this prefix
-                for arch, kernels in kernels_by_arch.items():
-                    all_kernels_by_arch[arch].extend(kernels)
-
-                # Track fat binaries in the generic artifact for later processing
-                fat_binaries_in_generic = []
-                for binary_path in classifier.fat_binaries:
-                    generic_binary_path = generic_prefix_dir / binary_path.relative_to(
-                        prefix_path
-                    )
-                    if generic_binary_path.exists():
-                        fat_binaries_in_generic.append(generic_binary_path)
+            # Accumulate kernels from this prefix
+            for arch, kernels in kernels_by_arch.items():
+                all_kernels_by_arch[arch].extend(kernels)
 
-                if fat_binaries_in_generic:
-                    fat_binaries_by_prefix[prefix] = fat_binaries_in_generic
+            if fat_binaries_in_generic:
+                fat_binaries_by_prefix[prefix] = fat_binaries_in_generic
 
         # Phase 5: Create kpack files from all accumulated kernels
         kpack_info_by_arch = {}
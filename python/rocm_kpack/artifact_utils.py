@@ -5,13 +5,24 @@ This module provides reusable utilities for working with TheRock artifacts,
 including manifest handling, directory traversal, and file classification.
 """
 
+import errno
+import mmap
 import os
+import shutil
+import struct
 import subprocess
+import threading
 from pathlib import Path
 from typing import Iterator, Tuple, Callable, Optional
 
 from rocm_kpack.binutils import Toolchain
 
+# ELF64 little-endian layouts used by the in-process .hip_fatbin probe
+_ELF64_SHOFF = struct.Struct("<Q")  # e_shoff at offset 40
+_ELF64_SHINFO = struct.Struct("<HHH")  # e_shentsize, e_shnum, e_shstrndx at 58
+_ELF64_SHDR = struct.Struct("<IIQQQQIIQQ")
+_HIP_FATBIN_NAME = b".hip_fatbin\0"
+
 
 def read_artifact_manifest(artifact_dir: Path) -> list[str]:
     """
@@ -52,9 +63,24 @@ def write_artifact_manifest(artifact_dir: Path, prefixes: list[str]) -> None:
         prefixes: List of prefix paths to write
     """
     manifest_path = artifact_dir / "artifact_manifest.txt"
-    with open(manifest_path, "w") as f:
-        for prefix in prefixes:
-            f.write(f"{prefix}\n")
+    # Write the whole manifest to a sibling temp file in one call, then
+    # rename it into place so readers never observe a partial manifest
+    data = "".join(f"{prefix}\n" for prefix in prefixes).encode()
+    tmp_path = artifact_dir / (
+        f".artifact_manifest.txt.{os.getpid()}.{threading.get_ident()}.tmp"
+    )
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view) :]
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, manifest_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
 
 
 def scan_directory(
@@ -73,23 +99,106 @@ def scan_directory(
     Yields:
         Tuples of (absolute_path, direntry) for each file/directory found
     """
+    # Explicit stack of open scandir iterators instead of recursive
+    # generators, so each entry is yielded directly rather than being passed
+    # up through one generator frame per directory level. Entries are still
+    # produced in depth-first pre-order.
+    stack = [(root_dir, os.scandir(root_dir))]
+    try:
+        while stack:
+            current_dir, it = stack[-1]
+            entry = next(it, None)
+            if entry is None:
+                it.close()
+                stack.pop()
+                continue
 
-    def scan_recursive(current_dir: Path):
-        with os.scandir(current_dir) as it:
-            for entry in it:
-                full_path = current_dir / entry.name
+            full_path = current_dir / entry.name
 
-                # Apply predicate if provided
-                if predicate and not predicate(full_path, entry):
-                    continue
+            # Apply predicate if provided
+            if predicate and not predicate(full_path, entry):
+                continue
 
-                yield full_path, entry
+            yield full_path, entry
 
-                # Recursively scan subdirectories (not following symlinks)
-                if entry.is_dir(follow_symlinks=False):
-                    yield from scan_recursive(full_path)
+            # Descend into subdirectories (not following symlinks)
+            if entry.is_dir(follow_symlinks=False):
+                stack.append((full_path, os.scandir(full_path)))
+    finally:
+        for _, it in stack:
+            it.close()
 
-    yield from scan_recursive(root_dir)
+
+def copy_file(src: Path, dst: Path) -> None:
+    """
+    Copy a file with its metadata, like shutil.copy2.
+
+    Uses os.copy_file_range where available so the data is copied (or
+    reflinked on copy-on-write filesystems) inside the kernel, falling back
+    to shutil.copy2 when the filesystem does not support it.
+
+    Args:
+        src: Source file path
+        dst: Destination file path
+    """
+    if not hasattr(os, "copy_file_range"):
+        shutil.copy2(src, dst)
+        return
+
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        try:
+            while os.copy_file_range(fsrc.fileno(), fdst.fileno(), 1 << 30):
+                pass
+        except OSError as e:
+            if e.errno not in (
+                errno.EXDEV,
+                errno.ENOSYS,
+                errno.EINVAL,
+                errno.EOPNOTSUPP,
+            ):
+                raise
+            fdst.close()
+            shutil.copy2(src, dst)
+            return
+    shutil.copystat(src, dst)
+
+
+def _probe_hip_fatbin(data) -> Optional[bool]:
+    """
+    Look for a .hip_fatbin section by parsing ELF64 section headers directly.
+
+    Args:
+        data: Buffer containing the whole ELF file
+
+    Returns:
+        Whether the section is present, or None if the buffer is not a
+        well-formed ELF64 little-endian file
+    """
+    size = len(data)
+    # EI_CLASS must be ELFCLASS64 and EI_DATA must be ELFDATA2LSB
+    if size < 64 or data[4] != 2 or data[5] != 1:
+        return None
+
+    (shoff,) = _ELF64_SHOFF.unpack_from(data, 40)
+    shentsize, shnum, shstrndx = _ELF64_SHINFO.unpack_from(data, 58)
+    # shnum == 0 with a non-zero shoff means extended section numbering
+    if shoff == 0 or shnum == 0 or shentsize != _ELF64_SHDR.size:
+        return None
+    if shstrndx >= shnum or shoff + shnum * shentsize > size:
+        return None
+
+    # Decode the whole section header table and string table in one pass each
+    shdrs = list(_ELF64_SHDR.iter_unpack(data[shoff : shoff + shnum * shentsize]))
+    strtab_offset, strtab_size = shdrs[shstrndx][4:6]
+    if strtab_offset + strtab_size > size:
+        return None
+    strtab = data[strtab_offset : strtab_offset + strtab_size]
+
+    return any(
+        strtab.startswith(_HIP_FATBIN_NAME, shdr[0])
+        for shdr in shdrs
+        if shdr[0] < strtab_size
+    )
 
 
 def is_fat_binary(file_path: Path, toolchain: Toolchain) -> bool:
@@ -97,7 +206,8 @@ def is_fat_binary(file_path: Path, toolchain: Toolchain) -> bool:
     Check if a file is a fat binary (contains GPU device code).
 
     For ELF binaries, this checks for the presence of a .hip_fatbin section.
-    Performs a fast ELF magic byte check before running readelf.
+    ELF64 little-endian section headers are parsed in-process; readelf is only
+    run for ELF files the in-process probe cannot parse.
 
     Args:
         file_path: Path to the file to check
@@ -110,25 +220,37 @@ def is_fat_binary(file_path: Path, toolchain: Toolchain) -> bool:
         RuntimeError: If readelf fails (corrupted file, readelf crash, etc.)
         FileNotFoundError: If file doesn't exist
     """
-    # Fast check: Is this even an ELF file?
+    # Fast check: Is this even an ELF file? If so, parse the section headers
+    # in-process from a mapping of the same descriptor; only fall back to
+    # readelf for layouts the probe does not understand (ELF32, big-endian,
+    # malformed)
     try:
         with open(file_path, "rb") as f:
             magic = f.read(4)
             if magic != b"\x7fELF":
                 return False  # Not an ELF file, definitely not a fat binary
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                found = _probe_hip_fatbin(data)
     except FileNotFoundError:
         raise
-    except OSError as e:
+    except (OSError, ValueError) as e:
         raise RuntimeError(f"Cannot read file {file_path}: {e}") from e
+    if found is not None:
+        return found
 
-    # It's an ELF file, now check for .hip_fatbin section
+    # Check for .hip_fatbin section with readelf. Wide output keeps long names
+    # untruncated; the name is the first column after the "[Nr]" index, and is
+    # matched exactly like the in-process probe does.
     try:
         output = subprocess.check_output(
-            [str(toolchain.readelf), "-S", str(file_path)],
+            [str(toolchain.readelf), "-SW", str(file_path)],
             stderr=subprocess.STDOUT,
             text=True,
         )
-        return ".hip_fatbin" in output
+        return any(
+            line.partition("]")[2].split()[:1] == [".hip_fatbin"]
+            for line in output.splitlines()
+        )
     except subprocess.CalledProcessError as e:
         # readelf returns 1 for valid ELF files without sections we're looking for
         # Returns 2+ for actual errors
@@ -159,8 +281,5 @@ def extract_architecture_from_target(target: str) -> Optional[str]:
         return None
 
     # Find the last occurrence of "--" and take everything after it
-    parts = target.rsplit("--", 1)
-    if len(parts) == 2:
-        return parts[1]
-
-    return None
+    _, sep, arch = target.rpartition("--")
+    return arch if sep else None
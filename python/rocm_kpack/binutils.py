@@ -1,10 +1,11 @@
 import argparse
+import os
 from pathlib import Path
 import shutil
 import subprocess
 import tempfile
 from enum import Enum
-from typing import Any
+from typing import Any, Callable
 
 import msgpack
 
@@ -16,6 +17,27 @@ class BinaryType(Enum):
     BUNDLED = "bundled"  # Executables/libraries with .hip_fatbin ELF section
 
 
+# Successful PATH searches keyed by (tool, PATH). Misses are not recorded, so
+# a tool installed later in the process is still found.
+_which_cache: dict[tuple[str, str | None], str] = {}
+
+
+def _which(tool_file_name: str, search_path: str | None) -> str | None:
+    """Search the system path for a tool, memoized per (tool, PATH) pair.
+
+    Toolchain instances are created freely (one per BundledBinary and per
+    helper call when none is passed), so the PATH search is shared across
+    instances rather than repeated by each of them.
+    """
+    key = (tool_file_name, search_path)
+    found = _which_cache.get(key)
+    if found is None:
+        found = shutil.which(tool_file_name, path=search_path)
+        if found is not None:
+            _which_cache[key] = found
+    return found
+
+
 class Toolchain:
     """Manages configuration of various toolchain locations.
 
@@ -55,7 +77,7 @@ class Toolchain:
         self, tool_file_name: str, explicit_path: Path | None
     ) -> Path:
         if explicit_path is None:
-            found_path = shutil.which(tool_file_name)
+            found_path = _which(tool_file_name, os.environ.get("PATH"))
             if found_path is None:
                 raise OSError(f"Could not file tool '{tool_file_name}' on system path")
             explicit_path = Path(found_path)
@@ -147,20 +169,31 @@ class BundledBinary:
     def __init__(self, file_path: Path, *, toolchain: Toolchain | None = None):
         # Initialize _temp_dir first to ensure cleanup works even if init fails
         self._temp_dir: Path | None = None  # For extracted .hip_fatbin sections
+        # (target_name, file_name) bundle listing, filled on first use
+        self._target_list: tuple[tuple[str, str], ...] | None = None
 
         self.toolchain = toolchain or Toolchain()
         self.file_path = file_path
         self.binary_type = self._detect_binary_type()
 
     def unbundle(
-        self, *, dest_dir: Path | None = None, delete_on_close: bool = True
+        self,
+        *,
+        dest_dir: Path | None = None,
+        delete_on_close: bool = True,
+        target_filter: Callable[[str], bool] | None = None,
     ) -> UnbundledContents:
         """Unbundles the binary, returning a context manager which can be used
         to hold the unbundled files open for as long as needed.
+
+        If target_filter is given, only targets for which it returns True are
+        extracted (and listed in the returned target_list).
         """
         if dest_dir is None:
             dest_dir = Path(tempfile.TemporaryDirectory(delete=False).name)
         target_list = self._list_bundled_targets(self.file_path)
+        if target_filter is not None:
+            target_list = [kv for kv in target_list if target_filter(kv[0])]
         contents = UnbundledContents(
             self, dest_dir, delete_on_close=delete_on_close, target_list=target_list
         )
@@ -254,7 +287,18 @@ class BundledBinary:
         return fatbin_path
 
     def _list_bundled_targets(self, file_path: Path) -> list[tuple[str, str]]:
-        """Returns a list of (target_name, file_name) for all bundles."""
+        """Returns a list of (target_name, file_name) for all bundles.
+
+        The listing is kept for the lifetime of this instance, so listing
+        again (e.g. list_bundles() followed by unbundle()) does not re-run
+        the extraction and bundler subprocesses.
+        """
+        if self._target_list is None:
+            self._target_list = tuple(self._list_bundled_targets_uncached())
+        return list(self._target_list)
+
+    def _list_bundled_targets_uncached(self) -> list[tuple[str, str]]:
+        """Lists bundles by running clang-offload-bundler on the bundler input."""
         bundler_input = self._get_bundler_input()
 
         # Try clang-offload-bundler first
@@ -610,6 +654,51 @@ def read_kpack_ref_marker(
             )
 
 
+def _read_section_table(
+    toolchain: Toolchain, binary_path: Path
+) -> list[tuple[str, str, int, str]]:
+    """Parse the named sections of an ELF binary from `readelf -SW`.
+
+    Wide output keeps long names untruncated and puts each section on one line:
+    [Nr] Name  Type  Address  Off  Size  ES  Flg  Lk  Inf  Al
+    Flg is blank for sections without flags, leaving one column fewer, and the
+    unnamed NULL section has one column fewer again, so it is never returned.
+
+    Args:
+        toolchain: Toolchain instance providing readelf
+        binary_path: Path to ELF binary
+
+    Returns:
+        (name, type, address, flags) for each named section, in header order
+
+    Raises:
+        subprocess.CalledProcessError: If readelf fails
+    """
+    output = toolchain.exec_capture_text([toolchain.readelf, "-SW", str(binary_path)])
+
+    sections = []
+    for line in output.splitlines():
+        # The index may be space-padded ("[ 1]"), so split it off rather than
+        # counting whitespace columns. This also skips the "[Nr]" column header.
+        head, sep, rest = line.partition("]")
+        index = head.strip()
+        if not sep or not index.startswith("[") or not index[1:].strip().isdigit():
+            continue
+        parts = rest.split()
+        if len(parts) == 10:
+            flags = parts[6]
+        elif len(parts) == 9:
+            flags = ""
+        else:
+            continue
+        try:
+            address = int(parts[2], 16)
+        except ValueError:
+            continue
+        sections.append((parts[0], parts[1], address, flags))
+    return sections
+
+
 def get_section_vaddr(
     toolchain: Toolchain, binary_path: Path, section_name: str
 ) -> int | None:
@@ -630,41 +719,15 @@ def get_section_vaddr(
         they are mapped to memory at load time (part of a PT_LOAD segment).
     """
     try:
-        # Run readelf to get section headers
-        result = subprocess.run(
-            [str(toolchain.readelf), "-S", str(binary_path)],
-            capture_output=True,
-            text=True,
-            check=True,
-        )
+        sections = _read_section_table(toolchain, binary_path)
     except subprocess.CalledProcessError:
         return None
 
-    # Parse section headers
-    # Format (two-line entries):
-    # Line 1: [Nr] Name              Type             Address           Offset
-    # Line 2:      Size              EntSize          Flags  Link  Info  Align
-    lines = result.stdout.split("\n")
-    for i, line in enumerate(lines):
-        if section_name in line:
-            parts = line.split()
-            # Check if this is a section header line (starts with [Nr])
-            if len(parts) >= 5 and parts[0].startswith("["):
-                try:
-                    # Address column is at index 3
-                    vaddr = int(parts[3], 16)
-
-                    # Check flags on the next line
-                    if i + 1 < len(lines):
-                        next_parts = lines[i + 1].split()
-                        if len(next_parts) >= 3:
-                            flags = next_parts[2]
-                            # Only return address if section has ALLOC flag (A)
-                            if "A" in flags:
-                                return vaddr
-
-                except (ValueError, IndexError):
-                    continue
+    # Compare names exactly so ".foo" does not match ".foo2"
+    for name, _, vaddr, flags in sections:
+        # Only return address if section has ALLOC flag (A)
+        if name == section_name and "A" in flags:
+            return vaddr
 
     return None
 
@@ -743,3 +806,31 @@ def get_section_type(
 
     except Exception:
         return None
+
+
+def get_section_types(
+    binary_path: Path,
+    *,
+    toolchain: Toolchain | None = None,
+) -> dict[str, str]:
+    """Get the types of all named sections in a binary from a single readelf run.
+
+    Prefer this over repeated has_section()/get_section_type() calls when
+    several sections of the same binary are inspected.
+
+    Args:
+        binary_path: Path to binary
+        toolchain: Toolchain instance (created if not provided)
+
+    Returns:
+        Dict mapping section name to type string (e.g., {".hip_fatbin": "NOBITS"}),
+        empty if the binary cannot be read
+    """
+    if toolchain is None:
+        toolchain = Toolchain()
+
+    try:
+        sections = _read_section_table(toolchain, binary_path)
+    except Exception:
+        return {}
+    return {name: section_type for name, section_type, _, _ in sections}
@@ -46,6 +46,21 @@ class DatabaseHandler(ABC):
         """
         pass
 
+    def path_patterns(self) -> tuple[str, ...]:
+        """
+        Return fnmatch patterns covering every path this handler can detect.
+
+        Patterns are matched against the POSIX path relative to the prefix
+        root and let callers skip detect() for files no handler could
+        claim. They only need to be a superset of what detect() accepts;
+        detect() still makes the final decision.
+
+        Returns:
+            Tuple of fnmatch patterns ("*" also matches "/")
+        """
+        # By default, every file is a candidate
+        return ("*",)
+
     def should_move(self, path: Path) -> bool:
         """
         Determine if this file should be moved to architecture-specific artifact.
@@ -66,6 +81,9 @@ class RocBLASHandler(DatabaseHandler):
     def name(self) -> str:
         return "rocblas"
 
+    def path_patterns(self) -> tuple[str, ...]:
+        return tuple(f"*rocblas/library*{ext}" for ext in (".co", ".hsaco", ".dat"))
+
     def detect(self, path: Path, prefix_root: Path) -> Optional[str]:
         """
         Detect rocBLAS kernel database files.
@@ -104,6 +122,9 @@ class HipBLASLtHandler(DatabaseHandler):
     def name(self) -> str:
         return "hipblaslt"
 
+    def path_patterns(self) -> tuple[str, ...]:
+        return tuple(f"*hipblaslt/library*{ext}" for ext in (".co", ".hsaco", ".dat"))
+
     def detect(self, path: Path, prefix_root: Path) -> Optional[str]:
         """
         Detect hipBLASLt kernel database files.
@@ -139,6 +160,9 @@ class AotritonHandler(DatabaseHandler):
     def name(self) -> str:
         return "aotriton"
 
+    def path_patterns(self) -> tuple[str, ...]:
+        return ("*aotriton/kernels/gfx*",)
+
     def detect(self, path: Path, prefix_root: Path) -> Optional[str]:
         """
         Detect AOTriton kernel files.
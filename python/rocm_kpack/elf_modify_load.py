@@ -55,6 +55,7 @@ class Elf64_Shdr(NamedTuple):
 
 # ELF constants
 PT_LOAD = 1
+PT_INTERP = 3
 PT_NOTE = 4
 PT_PHDR = 6
 PT_GNU_STACK = 0x6474E551
@@ -5,6 +5,7 @@ This module handles reading .kpm manifest files from the map phase and
 merging them into unified manifests for package groups.
 """
 
+import mmap
 from dataclasses import dataclass
 from pathlib import Path
 from typing import NamedTuple
@@ -60,8 +61,12 @@ class PackManifest:
             raise ValueError(f"Manifest file is empty: {manifest_path}")
 
         try:
-            with open(manifest_path, "rb") as f:
-                data = msgpack.unpack(f, raw=False)
+            # Decode straight from a mapping of the file rather than reading
+            # it into an intermediate bytes object first
+            with open(manifest_path, "rb") as f, mmap.mmap(
+                f.fileno(), 0, access=mmap.ACCESS_READ
+            ) as data_map:
+                data = msgpack.unpackb(data_map, raw=False, use_list=False)
         except msgpack.exceptions.UnpackException as e:
             raise ValueError(f"Invalid msgpack format in {manifest_path}: {e}") from e
         except OSError as e:
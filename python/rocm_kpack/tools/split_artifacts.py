@@ -12,18 +12,22 @@ Supports two modes:
 """
 
 import argparse
+import functools
 import os
 import re
 import sys
 import tempfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 from typing import Optional
 
 from rocm_kpack.artifact_splitter import ArtifactSplitter
 from rocm_kpack.binutils import Toolchain
 from rocm_kpack.database_handlers import get_database_handlers, list_available_handlers
+from rocm_kpack.parallel import get_worker_count
 
 
+@functools.lru_cache(maxsize=None)
 def parse_artifact_name(artifact_dir_name: str) -> Optional[str]:
     """
     Extract artifact prefix (name_component) from artifact directory name.
@@ -42,22 +46,18 @@ def parse_artifact_name(artifact_dir_name: str) -> Optional[str]:
     Returns:
         Artifact prefix (name_component) like "blas_lib", or None if target_family is "generic"
     """
-    parts = artifact_dir_name.split("_")
+    # Last underscore-separated part is the target family (arch); artifact
+    # prefix is everything before it
+    artifact_prefix, sep, target_family = artifact_dir_name.rpartition("_")
 
     # Need at least 2 parts: artifact prefix and target family
-    if len(parts) < 2:
+    if not sep:
         return None
 
-    # Last underscore-separated part is the target family (arch)
-    target_family = parts[-1]
-
     # Skip generic artifacts (the only semantic target_family value)
     if target_family == "generic":
         return None
 
-    # Artifact prefix is everything except the target family
-    artifact_prefix = "_".join(parts[:-1])
-
     return artifact_prefix
 
 
@@ -102,6 +102,8 @@ def single_split(args, toolchain: Toolchain):
         toolchain=toolchain,
         database_handlers=database_handlers,
         verbose=args.verbose,
+        max_workers=getattr(args, "max_workers", None),
+        architectures=getattr(args, "architectures", None),
     )
 
     print(f"Splitting artifact: {args.input_dir}")
@@ -113,6 +115,57 @@ def single_split(args, toolchain: Toolchain):
     print("Splitting complete!")
 
 
+def _split_group(
+    artifact_dirs: list[Path],
+    artifact_prefix: str,
+    output_dir: Path,
+    toolchain: Toolchain,
+    database_handlers: list,
+    verbose: bool,
+    max_workers: Optional[int] = None,
+    architectures: Optional[list[str]] = None,
+) -> dict[str, Optional[str]]:
+    """
+    Split artifacts sharing one artifact prefix, in order.
+
+    Runs in a worker process for batch mode, so failures are returned rather
+    than raised.
+
+    Args:
+        artifact_dirs: Artifact directories to split
+        artifact_prefix: Artifact prefix shared by all of them
+        output_dir: Output directory for split artifacts
+        toolchain: Toolchain instance
+        database_handlers: Database handler instances
+        verbose: Enable verbose output
+        max_workers: Worker limit for each ArtifactSplitter (None = all CPU cores)
+        architectures: Architectures to extract kernels for (None = all)
+
+    Returns:
+        Dict mapping artifact directory name to None on success or the error message
+    """
+    errors: dict[str, Optional[str]] = {}
+    for artifact_dir in artifact_dirs:
+        try:
+            splitter = ArtifactSplitter(
+                artifact_prefix=artifact_prefix,
+                toolchain=toolchain,
+                database_handlers=database_handlers,
+                verbose=verbose,
+                max_workers=max_workers,
+                architectures=architectures,
+            )
+            splitter.split(artifact_dir, output_dir)
+            errors[artifact_dir.name] = None
+        except Exception as e:
+            errors[artifact_dir.name] = str(e)
+            if verbose:
+                import traceback
+
+                traceback.print_exc()
+    return errors
+
+
 def batch_split(args, toolchain: Toolchain):
     """
     Process all arch-specific artifacts in batch mode.
@@ -141,10 +194,8 @@ def batch_split(args, toolchain: Toolchain):
     # Get database handlers once for all artifacts
     database_handlers = get_database_handlers_for_args(args)
 
-    total = 0
-    success = 0
     skipped = 0
-    failures = []
+    jobs: list[tuple[Path, str]] = []
 
     for artifact_dir in sorted(artifact_dirs):
         # Check if it has artifact_manifest.txt
@@ -163,31 +214,65 @@ def batch_split(args, toolchain: Toolchain):
             skipped += 1
             continue
 
-        total += 1
-        print(
-            f"[{total}] Processing: {artifact_dir.name} (artifact_prefix: {artifact_prefix})"
+        jobs.append((artifact_dir, artifact_prefix))
+
+    # Artifacts sharing an artifact prefix write to the same output artifacts,
+    # so each prefix's artifacts are split in order by a single worker; distinct
+    # prefixes are split in parallel processes.
+    groups: dict[str, list[Path]] = {}
+    for artifact_dir, artifact_prefix in jobs:
+        groups.setdefault(artifact_prefix, []).append(artifact_dir)
+
+    # --max-workers bounds the whole batch: it is divided between the group
+    # processes, and each process's splitter gets only its share, so nested
+    # pools never multiply the limit
+    total_workers = get_worker_count(getattr(args, "max_workers", None))
+    max_workers = min(len(groups) or 1, total_workers)
+    splitter_workers = max(1, total_workers // max_workers)
+    group_jobs = [
+        (
+            dirs,
+            prefix,
+            args.output_dir,
+            toolchain,
+            database_handlers,
+            args.verbose,
+            splitter_workers,
+            getattr(args, "architectures", None),
         )
+        for prefix, dirs in groups.items()
+    ]
 
-        # Run split
-        try:
-            splitter = ArtifactSplitter(
-                artifact_prefix=artifact_prefix,
-                toolchain=toolchain,
-                database_handlers=database_handlers,
-                verbose=args.verbose,
+    total = len(jobs)
+    success = 0
+    failures = []
+    processed = 0
+
+    def report(group_dirs: list[Path], group_errors: dict[str, Optional[str]]):
+        nonlocal success, processed
+        for artifact_dir in group_dirs:
+            processed += 1
+            print(
+                f"[{processed}/{total}] Processed: {artifact_dir.name} "
+                f"(artifact_prefix: {parse_artifact_name(artifact_dir.name)})"
             )
-
-            splitter.split(artifact_dir, args.output_dir)
-            success += 1
-            print(f"    ✓ Success")
-
-        except Exception as e:
-            failures.append((artifact_dir.name, str(e)))
-            print(f"    ✗ Failed: {e}", file=sys.stderr)
-            if args.verbose:
-                import traceback
-
-                traceback.print_exc()
+            error = group_errors[artifact_dir.name]
+            if error is None:
+                success += 1
+                print(f"    ✓ Success")
+            else:
+                failures.append((artifact_dir.name, error))
+                print(f"    ✗ Failed: {error}", file=sys.stderr)
+
+    # Each group is reported as soon as it finishes
+    if max_workers > 1:
+        with ProcessPoolExecutor(max_workers=max_workers) as ex:
+            futures = {ex.submit(_split_group, *job): job[0] for job in group_jobs}
+            for future in as_completed(futures):
+                report(futures[future], future.result())
+    else:
+        for job in group_jobs:
+            report(job[0], _split_group(*job))
 
     # Print summary
     print()
@@ -285,6 +370,24 @@ Batch Mode:
         help=f"Temporary directory for intermediate files (default: {tempfile.gettempdir()})",
     )
 
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=None,
+        help="Maximum number of concurrent workers; in batch mode this is "
+        "shared between the parallel artifact processes "
+        "(default: auto-detect CPU count)",
+    )
+
+    parser.add_argument(
+        "--architectures",
+        nargs="+",
+        default=None,
+        help="Only extract kernels for these architectures (e.g. gfx1100 "
+        "gfx942:xnack+); kernels for other architectures are dropped "
+        "(default: all architectures)",
+    )
+
     parser.add_argument("--verbose", action="store_true", help="Enable verbose output")
 
     parser.add_argument(
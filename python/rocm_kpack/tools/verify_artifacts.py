@@ -15,14 +15,13 @@ import re
 import sys
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
 
 import msgpack
 
-from rocm_kpack.binutils import Toolchain, has_section, get_section_type
+from rocm_kpack.binutils import Toolchain, get_section_types
 
 
-@dataclass
+@dataclass(slots=True)
 class VerificationResult:
     """Result of a single verification check."""
 
@@ -161,14 +160,14 @@ class ArtifactVerifier:
                 size_mb = file_size / (1024 * 1024)
                 rel_path = so_file.relative_to(artifact)
 
-                # Check if has .hip_fatbin section
-                section_info = self._get_hip_fatbin_section(so_file)
-                if section_info is None:
+                # Check if has .hip_fatbin section; one readelf run answers
+                # both the section type and the marker checks
+                section_types = get_section_types(so_file, toolchain=self.toolchain)
+                section_type = section_types.get(".hip_fatbin")
+                if section_type is None:
                     host_only_binaries.append((rel_path, size_mb))
                     continue
 
-                section_type, section_size = section_info
-
                 if section_type == "PROGBITS":
                     failed_binaries.append(
                         (rel_path, size_mb, "Still has PROGBITS .hip_fatbin")
@@ -176,7 +175,7 @@ class ArtifactVerifier:
                     all_passed = False
                 elif section_type == "NOBITS":
                     # Check for .rocm_kpack_ref marker
-                    has_marker = self._has_kpack_ref(so_file)
+                    has_marker = ".rocm_kpack_ref" in section_types
                     if has_marker:
                         converted_binaries.append((rel_path, size_mb))
                     else:
@@ -415,20 +414,6 @@ class ArtifactVerifier:
             )
         )
 
-    def _get_hip_fatbin_section(self, binary_path: Path) -> Optional[tuple[str, int]]:
-        """Get .hip_fatbin section type and size. Returns None if no section."""
-        section_type = get_section_type(
-            binary_path, ".hip_fatbin", toolchain=self.toolchain
-        )
-        if section_type is None:
-            return None
-        # Size is not critical for verification, just need to know type
-        return (section_type, 0)
-
-    def _has_kpack_ref(self, binary_path: Path) -> bool:
-        """Check if binary has .rocm_kpack_ref section."""
-        return has_section(binary_path, ".rocm_kpack_ref", toolchain=self.toolchain)
-
     def _fail(self, check_name: str, message: str) -> None:
         """Record a failed check."""
         self.results.append(VerificationResult(check_name, False, message, []))
@@ -26,17 +26,17 @@ def generate_noop_archive(output_dir: Path) -> None:
 
     # Add test kernels with recognizable patterns
     # Kernel 1: lib/libtest.so @ gfx900
-    kernel1_data = b"KERNEL1_GFX900_DATA" + b"\x00" * 100
+    kernel1_data = b"".join((b"KERNEL1_GFX900_DATA", b"\x00" * 100))
     prepared1 = archive.prepare_kernel("lib/libtest.so", "gfx900", kernel1_data)
     archive.add_kernel(prepared1)
 
     # Kernel 2: lib/libtest.so @ gfx906
-    kernel2_data = b"KERNEL2_GFX906_DATA" + b"\x00" * 200
+    kernel2_data = b"".join((b"KERNEL2_GFX906_DATA", b"\x00" * 200))
     prepared2 = archive.prepare_kernel("lib/libtest.so", "gfx906", kernel2_data)
     archive.add_kernel(prepared2)
 
     # Kernel 3: bin/testapp @ gfx900
-    kernel3_data = b"KERNEL3_APP_GFX900" + b"\xFF" * 150
+    kernel3_data = b"".join((b"KERNEL3_APP_GFX900", b"\xFF" * 150))
     prepared3 = archive.prepare_kernel("bin/testapp", "gfx900", kernel3_data)
     archive.add_kernel(prepared3)
 
@@ -62,17 +62,17 @@ def generate_zstd_archive(output_dir: Path) -> None:
 
     # Add test kernels with compressible patterns
     # Kernel 1: lib/libhip.so @ gfx1100
-    kernel1_data = b"HIP_KERNEL_GFX1100_" + b"A" * 500 + b"B" * 500
+    kernel1_data = b"".join((b"HIP_KERNEL_GFX1100_", b"A" * 500, b"B" * 500))
     prepared1 = archive.prepare_kernel("lib/libhip.so", "gfx1100", kernel1_data)
     archive.add_kernel(prepared1)
 
     # Kernel 2: lib/libhip.so @ gfx1101
-    kernel2_data = b"HIP_KERNEL_GFX1101_" + b"X" * 300 + b"Y" * 300
+    kernel2_data = b"".join((b"HIP_KERNEL_GFX1101_", b"X" * 300, b"Y" * 300))
     prepared2 = archive.prepare_kernel("lib/libhip.so", "gfx1101", kernel2_data)
     archive.add_kernel(prepared2)
 
     # Kernel 3: bin/hiptest @ gfx1100
-    kernel3_data = b"TEST_APP_KERNEL___" + b"\x42" * 1000
+    kernel3_data = b"".join((b"TEST_APP_KERNEL___", b"\x42" * 1000))
     prepared3 = archive.prepare_kernel("bin/hiptest", "gfx1100", kernel3_data)
     archive.add_kernel(prepared3)
 
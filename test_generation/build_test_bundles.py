@@ -5,25 +5,141 @@ Generates various permutations of bundled binaries for testing unbundling
 functionality across different platforms and compiler configurations.
 
 Usage:
-    python build_test_bundles.py [--rocm-path PATH]
+    python build_test_bundles.py [--rocm-path PATH] [--launcher NAME] [--jobs N]
+                                 [--log-dir DIR]
 """
 
 import argparse
+import collections
+import functools
+import io
 import os
 import platform
+import re
+import shutil
 import subprocess
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
 from pathlib import Path
 
 
+@dataclass(frozen=True)
+class HipVariant:
+    """A bundled test binary built from simple_kernel.hip.
+
+    Attributes:
+        name: Base name of the output (e.g., "test_kernel_single")
+        archs: GPU architectures to embed
+        description: Short description printed while building
+        shared: Build a shared library instead of an executable
+        compress: Request compressed code objects (falls back if unsupported)
+    """
+
+    name: str
+    archs: tuple[str, ...]
+    description: str
+    shared: bool = False
+    compress: bool = False
+
+    @property
+    def label(self) -> str:
+        """Name used in the build summary."""
+        return f"{self.name} ({'so/dll' if self.shared else 'exe'})"
+
+    def output_name(self, platform_name: str) -> str:
+        """Output file name for the given platform ("linux" or "windows")."""
+        if not self.shared:
+            return f"{self.name}.exe"
+        if platform_name == "windows":
+            return f"{self.name}.dll"
+        return f"lib{self.name}.so"
+
+
+# Bundled test binaries, in build/summary order. Each variant is a separate
+# hipcc invocation: with -fno-gpu-rdc the host object embeds the device fatbin,
+# so host compilation cannot be shared between architecture sets.
+HIP_VARIANTS = [
+    # Bundled executables
+    HipVariant("test_kernel_single", ("gfx1100",), "gfx1100 executable"),
+    HipVariant(
+        "test_kernel_multi", ("gfx1100", "gfx1101"), "gfx1100,gfx1101 executable"
+    ),
+    HipVariant(
+        "test_kernel_compressed",
+        ("gfx1100", "gfx1101"),
+        "gfx1100,gfx1101 with compression",
+        compress=True,
+    ),
+    HipVariant(
+        "test_kernel_wide",
+        ("gfx900", "gfx906", "gfx908", "gfx90a", "gfx1100"),
+        "gfx900,gfx906,gfx908,gfx90a,gfx1100",
+    ),
+    # Bundled shared libraries
+    HipVariant(
+        "test_kernel_single", ("gfx1100",), "gfx1100 shared library", shared=True
+    ),
+    HipVariant(
+        "test_kernel_multi",
+        ("gfx1100", "gfx1101"),
+        "gfx1100,gfx1101 shared library",
+        shared=True,
+    ),
+]
+
+
+# Names of generated binaries listed in the build summary
+GENERATED_FILE_RE = re.compile(r".*\.(exe|so|dll)$|(lib)?test_kernel_")
+
+# Environment overrides for compiler invocations. Compressed bundles use the
+# v3 CCOB format (64-bit sizes), which ccob_parser supports and which lifts the
+# 4GB limit of the v2 header for larger future assets.
+COMPILER_ENV = {"COMPRESSED_BUNDLE_FORMAT_VERSION": "3"}
+
+# Number of trailing compiler output lines repeated when a compile fails
+FAILURE_TAIL_LINES = 200
+
+
+@functools.lru_cache(maxsize=32)
+def _compiler_version_output(compiler: str, mtime_ns: int) -> str | None:
+    """Run `<compiler> --version` once per compiler binary.
+
+    Keyed on the compiler's mtime so that an upgraded toolchain is re-probed.
+
+    Returns:
+        The version output, or None if the probe failed
+    """
+    try:
+        result = subprocess.run(
+            [compiler, "--version"],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout
+
+
 class BundleBuilder:
     """Builder for HIP bundled binary test assets."""
 
-    def __init__(self, rocm_path: Path | None = None):
+    def __init__(
+        self,
+        rocm_path: Path | None = None,
+        launcher: str | None = None,
+        log_dir: Path | None = None,
+    ):
         """Initialize the builder.
 
         Args:
             rocm_path: Path to ROCm installation (auto-detected if None)
+            launcher: Compiler launcher (e.g. sccache, ccache) to prefix compiler
+                invocations with, "none" to disable, or None to auto-detect
+            log_dir: Directory to write a full transcript of each compile to
+                (optional)
         """
         self.script_dir = Path(__file__).parent
         self.kernel_src = self.script_dir / "simple_kernel.hip"
@@ -37,6 +153,8 @@ class BundleBuilder:
         self.rocm_path = self._find_rocm(rocm_path)
         self.hipcc = self._find_hipcc()
         self.clang = self._find_clang()
+        self.launcher = self._find_launcher(launcher)
+        self.log_dir = log_dir
 
         # Detect code object version
         self.code_object_version = self._detect_code_object_version()
@@ -50,6 +168,37 @@ class BundleBuilder:
             / f"cov{self.code_object_version}"
         )
 
+        # Per-thread output buffer, set while a build runs on a worker thread
+        self._task_output = threading.local()
+
+    def _log(self, message: str = "") -> None:
+        """Print a build message, buffering it if the build runs in parallel.
+
+        Args:
+            message: Line to print
+        """
+        buffer = getattr(self._task_output, "buffer", None)
+        if buffer is None:
+            print(message)
+        else:
+            buffer.write(message + "\n")
+
+    def _run_build(self, build) -> tuple[bool, str]:
+        """Run a single build method, capturing its output.
+
+        Args:
+            build: Bound build method returning True on success
+
+        Returns:
+            Tuple of (success, captured output)
+        """
+        buffer = io.StringIO()
+        self._task_output.buffer = buffer
+        try:
+            return build(), buffer.getvalue()
+        finally:
+            self._task_output.buffer = None
+
     def _find_rocm(self, explicit_path: Path | None) -> Path:
         """Find ROCm installation path.
 
@@ -123,31 +272,147 @@ class BundleBuilder:
             f"Could not find clang++ in ROCm installation at {self.rocm_path}"
         )
 
+    def _find_launcher(self, explicit: str | None) -> Path | None:
+        """Find a compiler launcher used to cache repeated compiles.
+
+        When sccache or ccache is available, compiler invocations are prefixed
+        with it so rebuilding unchanged sources is served from its cache.
+
+        Args:
+            explicit: Launcher name or path, "none" to disable, or None to
+                auto-detect (sccache preferred over ccache)
+
+        Returns:
+            Path to launcher executable, or None if no launcher is used
+
+        Raises:
+            RuntimeError: If an explicit launcher cannot be found
+        """
+        if explicit is not None:
+            if explicit.lower() == "none":
+                return None
+            found = shutil.which(explicit)
+            if found is None:
+                raise RuntimeError(f"Could not find compiler launcher: {explicit}")
+            return Path(found)
+
+        for name in ["sccache", "ccache"]:
+            found = shutil.which(name)
+            if found:
+                return Path(found)
+        return None
+
+    def _compiler_command(self, compiler: Path, args: list[str]) -> list[str]:
+        """Build a compiler command line, prefixed with the launcher if any."""
+        prefix = [str(self.launcher)] if self.launcher else []
+        return prefix + [str(compiler)] + args
+
+    def _compiler_version(self) -> str | None:
+        """Get the (memoized) compiler `--version` output.
+
+        Probes the bare clang++ driver first: hipcc is a wrapper script (a
+        .bat on Windows) that only forwards to clang, so invoking it adds an
+        interpreter launch per probe. Falls back to hipcc if clang++ fails.
+        """
+        for compiler in (self.clang, self.hipcc):
+            output = _compiler_version_output(
+                str(compiler), compiler.stat().st_mtime_ns
+            )
+            if output is not None:
+                return output
+        return None
+
     def _detect_code_object_version(self) -> str:
         """Detect code object version from compiler.
 
         Returns:
             Code object version string (e.g., "5", "6")
         """
+        output = self._compiler_version()
+        if output is None:
+            return "5"
+        # Try to extract code object version from output
+        for line in output.splitlines():
+            if "code object version" in line.lower():
+                # Extract version number
+                parts = line.split()
+                for part in parts:
+                    if part.isdigit():
+                        return part
+        # Default to 5 if not found
+        return "5"
+
+    def _run_compiler(
+        self,
+        compiler: Path,
+        args: list[str],
+        output_file: Path,
+        log_path: Path | None = None,
+    ) -> bool:
+        """Run a compiler, streaming its output as it is produced.
+
+        When running serially, output lines are echoed to the console as they
+        arrive. Parallel builds buffer their messages, so there only the last
+        FAILURE_TAIL_LINES lines are kept and reported if the compile fails.
+        The full transcript is tee'd to log_path if given.
+
+        Args:
+            compiler: Compiler executable
+            args: Arguments to pass to the compiler
+            output_file: Output file path
+            log_path: Optional file receiving the full compiler transcript
+
+        Returns:
+            True if successful, False otherwise
+        """
+        cmd = self._compiler_command(compiler, args)
+        self._log(f"  Running: {' '.join(cmd)}")
+
+        live = getattr(self._task_output, "buffer", None) is None
+        tail = collections.deque(maxlen=FAILURE_TAIL_LINES)
+        log_file = open(log_path, "w") if log_path else None
         try:
-            result = subprocess.run(
-                [str(self.hipcc), "--version"],
-                capture_output=True,
+            with subprocess.Popen(
+                cmd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
                 text=True,
-                check=True,
-            )
-            # Try to extract code object version from output
-            for line in result.stdout.splitlines():
-                if "code object version" in line.lower():
-                    # Extract version number
-                    parts = line.split()
-                    for part in parts:
-                        if part.isdigit():
-                            return part
-            # Default to 5 if not found
-            return "5"
-        except subprocess.CalledProcessError:
-            return "5"
+                errors="replace",
+                bufsize=1,
+                env={**os.environ, **COMPILER_ENV},
+            ) as proc:
+                for line in proc.stdout:
+                    line = line.rstrip("\n")
+                    if live:
+                        self._log(f"    {line}")
+                    else:
+                        tail.append(line)
+                    if log_file:
+                        log_file.write(line + "\n")
+                returncode = proc.wait()
+        finally:
+            if log_file:
+                log_file.close()
+
+        if returncode != 0:
+            self._log(f"  ✗ Failed: exit status {returncode}")
+            if tail:
+                self._log(f"  Last {len(tail)} line(s) of output:")
+                for line in tail:
+                    self._log(f"    {line}")
+            return False
+        if not output_file.exists():
+            self._log(f"  ✗ Failed: Output file not created")
+            return False
+        size_kb = output_file.stat().st_size / 1024
+        self._log(f"  ✓ Created: {output_file.name} ({size_kb:.1f} KB)")
+        return True
+
+    def _compile_log_path(self, output_file: Path) -> Path | None:
+        """Transcript path for a compile, if logging to a directory."""
+        if self.log_dir is None:
+            return None
+        return self.log_dir / f"{output_file.name}.log"
 
     def _run_hipcc(self, args: list[str], output_file: Path) -> bool:
         """Run hipcc with given arguments.
@@ -159,23 +424,9 @@ class BundleBuilder:
         Returns:
             True if successful, False otherwise
         """
-        cmd = [str(self.hipcc)] + args
-        print(f"  Running: {' '.join(cmd)}")
-
-        try:
-            subprocess.run(cmd, check=True, capture_output=True, text=True)
-            if output_file.exists():
-                size_kb = output_file.stat().st_size / 1024
-                print(f"  ✓ Created: {output_file.name} ({size_kb:.1f} KB)")
-                return True
-            else:
-                print(f"  ✗ Failed: Output file not created")
-                return False
-        except subprocess.CalledProcessError as e:
-            print(f"  ✗ Failed: {e}")
-            print(f"  stdout: {e.stdout}")
-            print(f"  stderr: {e.stderr}")
-            return False
+        return self._run_compiler(
+            self.hipcc, args, output_file, self._compile_log_path(output_file)
+        )
 
     def _run_clang(self, args: list[str], output_file: Path) -> bool:
         """Run clang++ with given arguments.
@@ -187,177 +438,42 @@ class BundleBuilder:
         Returns:
             True if successful, False otherwise
         """
-        cmd = [str(self.clang)] + args
-        print(f"  Running: {' '.join(cmd)}")
-
-        try:
-            subprocess.run(cmd, check=True, capture_output=True, text=True)
-            if output_file.exists():
-                size_kb = output_file.stat().st_size / 1024
-                print(f"  ✓ Created: {output_file.name} ({size_kb:.1f} KB)")
-                return True
-            else:
-                print(f"  ✗ Failed: Output file not created")
-                return False
-        except subprocess.CalledProcessError as e:
-            print(f"  ✗ Failed: {e}")
-            print(f"  stdout: {e.stdout}")
-            print(f"  stderr: {e.stderr}")
-            return False
-
-    def build_exe_compressed(self):
-        """Build executable with compressed bundles (if supported)."""
-        exe_name = "test_kernel_compressed.exe"
-        print(f"\nBuilding: {exe_name} (gfx1100,gfx1101 with compression)")
-        output = self.output_dir / exe_name
-
-        # Try with compression flag
-        success = self._run_hipcc(
-            [
-                str(self.kernel_src),
-                "--offload-arch=gfx1100",
-                "--offload-arch=gfx1101",
-                "-mllvm",
-                "--offload-compress",
-                "-o",
-                str(output),
-                "-fno-gpu-rdc",
-                "-DBUILD_EXECUTABLE",
-            ],
-            output,
+        return self._run_compiler(
+            self.clang, args, output_file, self._compile_log_path(output_file)
         )
 
-        if not success:
-            print("  ⚠ Compression may not be supported, trying without flag")
-            success = self._run_hipcc(
-                [
-                    str(self.kernel_src),
-                    "--offload-arch=gfx1100",
-                    "--offload-arch=gfx1101",
-                    "-o",
-                    str(output),
-                    "-fno-gpu-rdc",
-                    "-DBUILD_EXECUTABLE",
-                ],
-                output,
-            )
-
-        return success
-
-    def build_exe_wide_arch(self):
-        """Build executable with wide architecture coverage."""
-        exe_name = "test_kernel_wide.exe"
-        print(f"\nBuilding: {exe_name} (gfx900,gfx906,gfx908,gfx90a,gfx1100)")
-        output = self.output_dir / exe_name
+    def build_hip_variant(self, variant: "HipVariant") -> bool:
+        """Build one bundled (HIP) test binary.
 
-        return self._run_hipcc(
-            [
-                str(self.kernel_src),
-                "--offload-arch=gfx900",
-                "--offload-arch=gfx906",
-                "--offload-arch=gfx908",
-                "--offload-arch=gfx90a",
-                "--offload-arch=gfx1100",
-                "-o",
-                str(output),
-                "-fno-gpu-rdc",
-                "-DBUILD_EXECUTABLE",
-            ],
-            output,
-        )
-
-    def build_executable_single_arch(self):
-        """Build executable with single architecture."""
-        exe_name = "test_kernel_single.exe"
-        print(f"\nBuilding: {exe_name} (gfx1100 executable)")
-        output = self.output_dir / exe_name
-
-        return self._run_hipcc(
-            [
-                str(self.kernel_src),
-                "--offload-arch=gfx1100",
-                "-o",
-                str(output),
-                "-fno-gpu-rdc",
-                "-DBUILD_EXECUTABLE",
-            ],
-            output,
-        )
-
-    def build_executable_multi_arch(self):
-        """Build executable with multiple architectures."""
-        exe_name = "test_kernel_multi.exe"
-        print(f"\nBuilding: {exe_name} (gfx1100,gfx1101 executable)")
-        output = self.output_dir / exe_name
-
-        return self._run_hipcc(
-            [
-                str(self.kernel_src),
-                "--offload-arch=gfx1100",
-                "--offload-arch=gfx1101",
-                "-o",
-                str(output),
-                "-fno-gpu-rdc",
-                "-DBUILD_EXECUTABLE",
-            ],
-            output,
-        )
-
-    def build_shared_lib_single_arch(self):
-        """Build shared library with single architecture."""
-        if self.platform == "windows":
-            lib_name = "test_kernel_single.dll"
-            shared_flag = "-shared"
-        else:
-            lib_name = "libtest_kernel_single.so"
-            shared_flag = "-shared"
-
-        print(f"\nBuilding: {lib_name} (gfx1100 shared library)")
-        output = self.output_dir / lib_name
-
-        return self._run_hipcc(
-            [
-                str(self.kernel_src),
-                "--offload-arch=gfx1100",
-                "-o",
-                str(output),
-                "-fno-gpu-rdc",
-                shared_flag,
-                "-fPIC",
-            ],
-            output,
-        )
+        Args:
+            variant: Description of the binary to build
 
-    def build_shared_lib_multi_arch(self):
-        """Build shared library with multiple architectures."""
-        if self.platform == "windows":
-            lib_name = "test_kernel_multi.dll"
-            shared_flag = "-shared"
+        Returns:
+            True if successful, False otherwise
+        """
+        output = self.output_dir / variant.output_name(self.platform)
+        self._log(f"\nBuilding: {output.name} ({variant.description})")
+
+        args = [str(self.kernel_src)]
+        args.extend(f"--offload-arch={arch}" for arch in variant.archs)
+        args.extend(["-o", str(output), "-fno-gpu-rdc"])
+        if variant.shared:
+            args.extend(["-shared", "-fPIC"])
         else:
-            lib_name = "libtest_kernel_multi.so"
-            shared_flag = "-shared"
+            args.append("-DBUILD_EXECUTABLE")
 
-        print(f"\nBuilding: {lib_name} (gfx1100,gfx1101 shared library)")
-        output = self.output_dir / lib_name
+        if variant.compress:
+            # Try with compression flag
+            if self._run_hipcc(args + ["-mllvm", "--offload-compress"], output):
+                return True
+            self._log("  ⚠ Compression may not be supported, trying without flag")
 
-        return self._run_hipcc(
-            [
-                str(self.kernel_src),
-                "--offload-arch=gfx1100",
-                "--offload-arch=gfx1101",
-                "-o",
-                str(output),
-                "-fno-gpu-rdc",
-                shared_flag,
-                "-fPIC",
-            ],
-            output,
-        )
+        return self._run_hipcc(args, output)
 
     def build_host_only_executable(self):
         """Build host-only executable (no GPU device code)."""
         exe_name = "host_only.exe"
-        print(f"\nBuilding: {exe_name} (host-only executable, no GPU code)")
+        self._log(f"\nBuilding: {exe_name} (host-only executable, no GPU code)")
         output = self.output_dir / exe_name
 
         return self._run_clang(
@@ -377,7 +493,7 @@ class BundleBuilder:
         else:
             lib_name = "libhost_only.so"
 
-        print(f"\nBuilding: {lib_name} (host-only shared library, no GPU code)")
+        self._log(f"\nBuilding: {lib_name} (host-only shared library, no GPU code)")
         output = self.output_dir / lib_name
 
         return self._run_clang(
@@ -398,16 +514,8 @@ class BundleBuilder:
         manifest_path = self.output_dir / "MANIFEST.txt"
 
         # Get compiler version
-        try:
-            result = subprocess.run(
-                [str(self.hipcc), "--version"],
-                capture_output=True,
-                text=True,
-                check=True,
-            )
-            compiler_version = result.stdout.splitlines()[0]
-        except:
-            compiler_version = "Unknown"
+        output = self._compiler_version()
+        compiler_version = output.splitlines()[0] if output else "Unknown"
 
         lib_prefix = "" if self.platform == "windows" else "lib"
         lib_ext = ".dll" if self.platform == "windows" else ".so"
@@ -452,34 +560,60 @@ These assets are used to test unbundling functionality across:
         manifest_path.write_text(content)
         print(f"\n✓ Manifest created: {manifest_path}")
 
-    def build_all(self):
-        """Build all test bundles."""
+    def build_all(self, jobs: int | None = None):
+        """Build all test bundles.
+
+        The builds are independent, so they run concurrently on a thread pool
+        (each hipcc/clang++ invocation is its own process). Output of each build
+        is buffered and printed as a block once that build completes. With a
+        single job the builds run in order and print as they go.
+
+        Args:
+            jobs: Maximum number of concurrent builds (default: CPU count)
+        """
         print("=" * 70)
         print("Building Test Bundled Binaries")
         print("=" * 70)
         print(f"ROCm Path: {self.rocm_path}")
         print(f"Compiler: {self.hipcc}")
+        print(f"Compiler Launcher: {self.launcher or 'none'}")
         print(f"Code Object Version: {self.code_object_version}")
         print(f"Platform: {self.platform}")
         print(f"Output Directory: {self.output_dir}")
 
         # Create output directory
         self.output_dir.mkdir(parents=True, exist_ok=True)
-
-        # Build all variants
-        results = {
-            # Bundled executables
-            "test_kernel_single (exe)": self.build_executable_single_arch(),
-            "test_kernel_multi (exe)": self.build_executable_multi_arch(),
-            "test_kernel_compressed (exe)": self.build_exe_compressed(),
-            "test_kernel_wide (exe)": self.build_exe_wide_arch(),
-            # Bundled shared libraries
-            "test_kernel_single (so/dll)": self.build_shared_lib_single_arch(),
-            "test_kernel_multi (so/dll)": self.build_shared_lib_multi_arch(),
-            # Host-only binaries (for negative testing)
-            "host_only (exe)": self.build_host_only_executable(),
-            "host_only (so/dll)": self.build_host_only_shared_lib(),
+        if self.log_dir is not None:
+            self.log_dir.mkdir(parents=True, exist_ok=True)
+
+        # Build all variants: bundled executables and shared libraries, then
+        # host-only binaries (for negative testing)
+        builds = {
+            variant.label: functools.partial(self.build_hip_variant, variant)
+            for variant in HIP_VARIANTS
         }
+        builds["host_only (exe)"] = self.build_host_only_executable
+        builds["host_only (so/dll)"] = self.build_host_only_shared_lib
+
+        max_workers = min(len(builds), jobs or os.cpu_count() or 1)
+        completed = {}
+        if max_workers == 1:
+            # Serial builds print (and stream compiler output) directly
+            for name, build in builds.items():
+                completed[name] = build()
+        else:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    executor.submit(self._run_build, build): name
+                    for name, build in builds.items()
+                }
+                for future in as_completed(futures):
+                    success, output = future.result()
+                    print(output, end="")
+                    completed[futures[future]] = success
+
+        # Report in declaration order regardless of completion order
+        results = {name: completed[name] for name in builds}
 
         # Generate manifest
         self.generate_manifest()
@@ -494,15 +628,16 @@ These assets are used to test unbundling functionality across:
 
         # List all generated files
         print(f"\nGenerated files in {self.output_dir}:")
-        # List all binary files (executables, libraries)
-        patterns = ["*.exe", "*.so", "*.dll", "test_kernel_*", "libtest_kernel_*"]
-        seen_files = set()
-        for pattern in patterns:
-            for file in sorted(self.output_dir.glob(pattern)):
-                if file.name != "MANIFEST.txt" and file not in seen_files:
-                    size_kb = file.stat().st_size / 1024
-                    print(f"  {file.name:40} {size_kb:8.1f} KB")
-                    seen_files.add(file)
+        # List all binary files (executables, libraries) in a single pass
+        # over the directory, ordered by name
+        with os.scandir(self.output_dir) as it:
+            entries = sorted(
+                (e for e in it if GENERATED_FILE_RE.match(e.name)),
+                key=lambda e: e.name,
+            )
+        for entry in entries:
+            size_kb = entry.stat().st_size / 1024
+            print(f"  {entry.name:40} {size_kb:8.1f} KB")
 
         total_success = sum(results.values())
         total_builds = len(results)
@@ -520,12 +655,31 @@ def main():
         type=Path,
         help="Path to ROCm installation (auto-detected if not specified)",
     )
+    parser.add_argument(
+        "--launcher",
+        help="Compiler launcher to cache compiles (e.g. sccache, ccache), or "
+        "'none' to disable (default: auto-detect sccache, then ccache)",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=None,
+        help="Maximum number of concurrent builds (default: CPU count)",
+    )
+    parser.add_argument(
+        "--log-dir",
+        type=Path,
+        help="Directory to write a full transcript of each compile to",
+    )
 
     args = parser.parse_args()
 
     try:
-        builder = BundleBuilder(rocm_path=args.rocm_path)
-        success = builder.build_all()
+        builder = BundleBuilder(
+            rocm_path=args.rocm_path, launcher=args.launcher, log_dir=args.log_dir
+        )
+        success = builder.build_all(jobs=args.jobs)
         sys.exit(0 if success else 1)
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
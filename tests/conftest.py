@@ -1,7 +1,15 @@
+import functools
+import os
 import pytest
 import pathlib
+import shutil
 
 from rocm_kpack.binutils import Toolchain
+from rocm_kpack.elf_modify_load import (
+    PT_INTERP,
+    read_elf_header,
+    read_program_header,
+)
 
 
 @pytest.fixture(scope="session")
@@ -15,20 +23,70 @@ def test_assets_dir() -> pathlib.Path:
     return test_assets_path.resolve()
 
 
+@functools.lru_cache(maxsize=1)
+def _find_bundler() -> pathlib.Path | None:
+    """Locate clang-offload-bundler for tests.
+
+    Checks the CLANG_OFFLOAD_BUNDLER environment variable, then PATH, then the
+    default ROCm install location.
+    """
+    explicit = os.environ.get("CLANG_OFFLOAD_BUNDLER")
+    if explicit:
+        return pathlib.Path(explicit)
+    found = shutil.which("clang-offload-bundler")
+    if found:
+        return pathlib.Path(found)
+    default = pathlib.Path("/opt/rocm/llvm/bin/clang-offload-bundler")
+    return default if default.exists() else None
+
+
 @pytest.fixture(scope="session")
 def toolchain() -> Toolchain:
     """Provides a Toolchain, using ROCm installation if available."""
-    # Try to find clang-offload-bundler in common ROCm locations
-    potential_paths = [
-        pathlib.Path(
-            "/home/stella/workspace/rocm/gfx1100/lib/llvm/bin/clang-offload-bundler"
-        ),
-        pathlib.Path("/opt/rocm/llvm/bin/clang-offload-bundler"),
-    ]
-
-    for path in potential_paths:
-        if path.exists():
-            return Toolchain(clang_offload_bundler=path)
-
-    # Fall back to system PATH
-    return Toolchain()
+    return Toolchain(clang_offload_bundler=_find_bundler())
+
+
+@pytest.fixture(scope="session")
+def elf_cache():
+    """Provides a loader returning (data, ehdr) for an ELF file.
+
+    Results are memoized by (path, mtime, size), so assertions that inspect
+    the same binary repeatedly parse it once, while rewritten files are
+    reloaded automatically.
+    """
+    cache = {}
+
+    def load(path):
+        path = pathlib.Path(path)
+        st = path.stat()
+        key = (str(path), st.st_mtime_ns, st.st_size)
+        if key not in cache:
+            data = path.read_bytes()
+            cache[key] = (data, read_elf_header(data))
+        return cache[key]
+
+    yield load
+    cache.clear()
+
+
+@pytest.fixture(scope="session")
+def elf_info(elf_cache):
+    """Provides a function summarizing an ELF file in one pass.
+
+    The function returns (elf_class, interp, e_phoff): elf_class is 32 or 64
+    (from EI_CLASS), interp is the PT_INTERP path or None.
+    """
+
+    def info(path):
+        data, ehdr = elf_cache(path)
+        elf_class = {1: 32, 2: 64}.get(data[4])
+        interp = None
+        for i in range(ehdr.e_phnum):
+            phdr = read_program_header(data, ehdr.e_phoff + i * 56)
+            if phdr.p_type == PT_INTERP:
+                raw = data[phdr.p_offset : phdr.p_offset + phdr.p_filesz]
+                interp = raw.rstrip(b"\0").decode("utf-8", "replace")
+                break
+        return elf_class, interp, ehdr.e_phoff
+
+    return info
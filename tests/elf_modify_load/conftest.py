@@ -0,0 +1,282 @@
+"""Shared fixtures for the ELF modification tests.
+
+The C test binaries are built once per session and shared by every module in
+this directory.
+"""
+
+import functools
+import hashlib
+import os
+import shutil
+import subprocess
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+# Test directory containing C sources
+TEST_DIR = Path(__file__).parent
+
+# Resolved once so each compile/link does not repeat the PATH search. The test
+# modules skip themselves when gcc is missing, so the fallback is never run.
+GCC = shutil.which("gcc") or "gcc"
+
+
+def _test_cache_dir() -> Path | None:
+    """Directory for cached test binaries, or None if caching is disabled.
+
+    Set KPACK_TEST_CACHE to relocate the cache, or KPACK_DISABLE_TEST_CACHE=1
+    to always rebuild.
+    """
+    if os.environ.get("KPACK_DISABLE_TEST_CACHE") == "1":
+        return None
+    return Path(
+        os.environ.get("KPACK_TEST_CACHE", "~/.cache/rocm-kpack-tests")
+    ).expanduser()
+
+
+@functools.lru_cache(maxsize=None)
+def _gcc_version() -> bytes:
+    """Output of gcc --version, part of the cache key for compiled binaries."""
+    return subprocess.run([GCC, "--version"], capture_output=True).stdout
+
+
+def _cached_binary(
+    source: Path,
+    output: Path,
+    cflags: list[str],
+    ldflags: list[str],
+    extra: bytes = b"",
+) -> Path | None:
+    """Cache location for a compiled test binary, or None if caching is off.
+
+    Args:
+        extra: Additional key material for post-link processing steps
+    """
+    cache_dir = _test_cache_dir()
+    if cache_dir is None:
+        return None
+    key = hashlib.sha256(
+        source.read_bytes()
+        + output.name.encode()
+        + repr((cflags, ldflags)).encode()
+        + _gcc_version()
+        + extra
+    ).hexdigest()
+    return cache_dir / key / output.name
+
+
+def _store_cached_binary(output: Path, cached: Path) -> None:
+    """Populate a cache entry from a freshly built binary."""
+    # Populate atomically: stage in a temp dir, then rename into place. If
+    # another session won the race, its entry is kept and ours discarded.
+    cached.parent.parent.mkdir(parents=True, exist_ok=True)
+    staging = Path(tempfile.mkdtemp(dir=cached.parent.parent))
+    shutil.copy2(output, staging / output.name)
+    try:
+        staging.rename(cached.parent)
+    except OSError:
+        shutil.rmtree(staging, ignore_errors=True)
+
+
+def _read_all(fd: int) -> bytes:
+    chunks = []
+    while chunk := os.read(fd, 65536):
+        chunks.append(chunk)
+    os.close(fd)
+    return b"".join(chunks)
+
+
+@functools.lru_cache(maxsize=64)
+def _run_binary_cached(path: str, mtime_ns: int, size: int) -> tuple[int, str, str]:
+    # posix_spawn avoids subprocess's fork+exec machinery. The test binaries
+    # print a few lines at most, so draining stdout before stderr cannot fill
+    # the stderr pipe and deadlock.
+    out_r, out_w = os.pipe()
+    err_r, err_w = os.pipe()
+    try:
+        pid = os.posix_spawn(
+            path,
+            [path],
+            os.environ,
+            file_actions=[
+                (os.POSIX_SPAWN_DUP2, out_w, 1),
+                (os.POSIX_SPAWN_DUP2, err_w, 2),
+            ],
+        )
+    finally:
+        os.close(out_w)
+        os.close(err_w)
+    stdout = _read_all(out_r)
+    stderr = _read_all(err_r)
+    _, status = os.waitpid(pid, 0)
+    return (
+        os.waitstatus_to_exitcode(status),
+        stdout.decode("ascii", "replace"),
+        stderr.decode("ascii", "replace"),
+    )
+
+
+@pytest.fixture(scope="session")
+def run_binary():
+    """Provides a function running a binary, returning (exit_code, stdout, stderr).
+
+    The test binaries are deterministic, so results are memoized by
+    (path, mtime, size); rewriting a binary invalidates its entry.
+    """
+
+    def run(binary_path: Path) -> tuple[int, str, str]:
+        st = binary_path.stat()
+        return _run_binary_cached(str(binary_path), st.st_mtime_ns, st.st_size)
+
+    return run
+
+
+def compile_c_binaries(
+    builds: list[tuple[Path, Path]], cflags: list[str], ldflags: list[str]
+) -> list[str | None]:
+    """
+    Compile C test binaries with gcc, reusing cached builds when possible.
+
+    Builds are cached under a key derived from the source contents, output
+    name, flags and gcc version, so unchanged sources are copied from the
+    cache instead of being recompiled on every session. All remaining
+    sources are compiled to objects by a single `gcc -pipe -c` invocation,
+    then each binary is linked concurrently.
+
+    Args:
+        builds: (source, output) pairs; sources must have distinct stems
+        cflags: Additional gcc flags for the compile step
+        ldflags: Additional gcc flags for the link step
+
+    Returns:
+        For each build, None on success or gcc's stderr if it failed
+    """
+    errors: list[str | None] = [None] * len(builds)
+    misses = []
+    for i, (source, output) in enumerate(builds):
+        cached = _cached_binary(source, output, cflags, ldflags)
+        if cached is not None and cached.exists():
+            shutil.copy2(cached, output)
+        else:
+            misses.append((i, source, output, cached))
+    if not misses:
+        return errors
+
+    with tempfile.TemporaryDirectory() as tmp:
+        result = subprocess.run(
+            [
+                GCC,
+                "-pipe",
+                "-c",
+                *cflags,
+                *(str(source) for _, source, _, _ in misses),
+            ],
+            capture_output=True,
+            cwd=tmp,
+        )
+        if result.returncode != 0:
+            stderr = result.stderr.decode("utf-8", "replace")
+            for i, _, _, _ in misses:
+                errors[i] = stderr
+            return errors
+
+        def link(miss):
+            i, source, output, cached = miss
+            obj = Path(tmp) / f"{source.stem}.o"
+            result = subprocess.run(
+                [GCC, str(obj), "-o", str(output), *ldflags],
+                capture_output=True,
+            )
+            if result.returncode != 0:
+                errors[i] = result.stderr.decode("utf-8", "replace")
+            elif cached is not None:
+                _store_cached_binary(output, cached)
+
+        with ThreadPoolExecutor(
+            max_workers=min(len(misses), os.cpu_count() or 1)
+        ) as ex:
+            list(ex.map(link, misses))
+
+    return errors
+
+
+@pytest.fixture(scope="session")
+def build_test_binaries(tmp_path_factory):
+    """Build all C test binaries before running tests.
+
+    Binaries are built into a private temporary directory, so concurrent
+    sessions (e.g. pytest-xdist workers) do not clobber each other's outputs.
+
+    Returns:
+        Dict mapping test name to built binary path
+    """
+    test_cases = [
+        "test_zero_page_aligned",
+        "test_zero_page_unaligned_start",
+        "test_zero_page_unaligned_size",
+        "test_zero_page_both_unaligned",
+    ]
+
+    build_dir = tmp_path_factory.mktemp("zero_page")
+    binaries = {test_name: build_dir / test_name for test_name in test_cases}
+
+    errors = compile_c_binaries(
+        [(TEST_DIR / f"{name}.c", path) for name, path in binaries.items()],
+        ["-O0", "-g"],
+        # Link with page-aligned section
+        ["-Wl,--section-start=.testdata=0x10000"],
+    )
+
+    failures = [
+        f"Failed to build {test_name}: {error}"
+        for test_name, error in zip(test_cases, errors)
+        if error is not None
+    ]
+    if failures:
+        pytest.fail("\n".join(failures))
+
+    return binaries
+
+
+@pytest.fixture(scope="session")
+def build_mapped_section_test(tmp_path_factory):
+    """Build the test_mapped_section binary, reusing a cached build if possible."""
+    build_dir = tmp_path_factory.mktemp("mapped_section")
+    source = TEST_DIR / "test_mapped_section.c"
+    # Assembles .custom_data without the ALLOC flag, so the section exists in
+    # the ELF file but is NOT mapped to memory
+    data_source = TEST_DIR / "test_mapped_section_data.S"
+    output = build_dir / "test_mapped_section"
+    cflags = ["-O0", "-g"]
+
+    cached = _cached_binary(source, output, cflags, [], extra=data_source.read_bytes())
+
+    if cached is not None and cached.exists():
+        shutil.copy2(cached, output)
+        return output
+
+    # Compile as PIE (Position Independent Executable) - the common case
+    # Most modern executables are PIE, and all shared libraries are position-independent
+    # Tests use auto-allocated addresses which work with PIE's relative addressing
+    result = subprocess.run(
+        [
+            GCC,
+            *cflags,
+            "-o",
+            str(output),
+            str(source),
+            str(data_source),
+        ],
+        capture_output=True,
+        text=True,
+    )
+
+    if result.returncode != 0:
+        pytest.fail(f"Failed to build test_mapped_section: {result.stderr}")
+
+    if cached is not None:
+        _store_cached_binary(output, cached)
+
+    return output
@@ -12,166 +12,141 @@ This module tests:
 Uses C test binaries that validate different scenarios.
 """
 
+import bisect
+import contextlib
+import io
+import os
+import re
+import shutil
+import struct
 import subprocess
 import pytest
 from pathlib import Path
 
-from rocm_kpack.elf_modify_load import main
+from rocm_kpack.elf_modify_load import (
+    PT_LOAD,
+    SHF_ALLOC,
+    SHT_RELA,
+    find_section_by_name,
+    get_section_name,
+    main,
+    map_section_to_new_load,
+    read_program_header,
+    read_rela_entry,
+    read_section_header,
+    set_pointer,
+)
 from rocm_kpack.binutils import get_section_vaddr
 
 
-# Test directory containing C sources and built binaries
+if shutil.which("gcc") is None:
+    pytest.skip("gcc not available", allow_module_level=True)
+
+# Test directory containing C sources
 TEST_DIR = Path(__file__).parent
-PROJECT_ROOT = TEST_DIR.parent.parent
+
+# Little-endian 64-bit pointer
+_U64_LE = struct.Struct("<Q")
+
+# Savings line printed by the zero-page command
+_SAVED_RE = re.compile(r"Saved: ([\d,]+) bytes")
+
+
+def _read_u64(path: Path, offset: int) -> int:
+    """Read one little-endian 64-bit value from a file without loading it."""
+    with open(path, "rb") as f:
+        (value,) = _U64_LE.unpack(os.pread(f.fileno(), _U64_LE.size, offset))
+    return value
 
 
-def is_section_in_pt_load(binary_path: Path, section_name: str) -> bool:
+# PT_LOAD bounds per binary as (sorted starts, ends), keyed like elf_cache
+_pt_load_bounds: dict[tuple[str, int, int], tuple[list[int], list[int]]] = {}
+
+
+def _in_pt_load(bounds: tuple[list[int], list[int]], addr: int) -> bool:
+    """Check whether addr falls in one of the (non-overlapping) PT_LOAD ranges."""
+    starts, ends = bounds
+    i = bisect.bisect_right(starts, addr) - 1
+    return i >= 0 and addr < ends[i]
+
+
+def is_section_in_pt_load(binary_path: Path, section_name: str, elf_cache) -> bool:
     """
     Check if a section is mapped to memory via a PT_LOAD segment.
 
+    Parses the ELF section and program header tables in-process rather than
+    shelling out to readelf. The PT_LOAD ranges of each binary are sorted once
+    and then queried by bisection.
+
     Args:
         binary_path: Path to ELF binary
         section_name: Name of section to check (e.g., ".custom_data")
+        elf_cache: Loader from the elf_cache fixture
 
     Returns:
         True if section is in a PT_LOAD segment, False otherwise
     """
-    # Get section virtual address and size
-    result = subprocess.run(
-        ["readelf", "-S", str(binary_path)],
-        capture_output=True,
-        text=True,
-    )
-
-    if result.returncode != 0:
+    try:
+        data, ehdr = elf_cache(binary_path)
+    except ValueError:
         return False
 
-    section_vaddr = None
-    section_size = None
-    section_flags = None
-
-    # Section headers span two lines:
-    # Line 1: [Nr] Name Type Address Offset
-    # Line 2:      Size EntSize Flags Link Info Align
-    lines = result.stdout.split("\n")
-    for i, line in enumerate(lines):
-        if section_name in line:
-            parts = line.split()
-            if len(parts) >= 5:
-                try:
-                    section_vaddr = int(parts[3], 16)  # Address column
-                    # Next line has size and flags
-                    if i + 1 < len(lines):
-                        next_parts = lines[i + 1].split()
-                        if len(next_parts) >= 3:
-                            section_size = int(next_parts[0], 16)  # Size
-                            section_flags = next_parts[2]  # Flags column
-                    break
-                except (ValueError, IndexError):
-                    continue
-
-    if section_vaddr is None:
+    section = find_section_by_name(data, ehdr, section_name)
+    if section is None:
         return False  # Section doesn't exist
+    _, shdr = section
 
     # Non-ALLOC sections are never in PT_LOAD, even if vaddr overlaps
-    if section_flags and "A" not in section_flags:
+    if not shdr.sh_flags & SHF_ALLOC:
         return False
 
-    # Get PT_LOAD segments
-    result = subprocess.run(
-        ["readelf", "-l", str(binary_path)],
-        capture_output=True,
-        text=True,
-    )
-
-    if result.returncode != 0:
-        return False
-
-    # Parse PT_LOAD segments and check if section falls within any
-    # Note: readelf output spans multiple lines:
-    #   LOAD           0xoffset 0xvaddr 0xpaddr
-    #                  0xfilesz 0xmemsz flags align
-    lines = result.stdout.split("\n")
-    i = 0
-    while i < len(lines):
-        line = lines[i].strip()
-        if line.startswith("LOAD"):
-            # First line has: LOAD offset vaddr paddr
-            parts1 = line.split()
-            if len(parts1) >= 3:
-                try:
-                    load_vaddr = int(parts1[2], 16)  # Virtual address
-
-                    # Next line has: filesz memsz flags align
-                    if i + 1 < len(lines):
-                        parts2 = lines[i + 1].split()
-                        if len(parts2) >= 2:
-                            load_memsz = int(parts2[1], 16)  # Memory size
-                            load_end = load_vaddr + load_memsz
-
-                            # Check if section is within this PT_LOAD
-                            section_end = section_vaddr + section_size
-                            if (
-                                load_vaddr <= section_vaddr < load_end
-                                or load_vaddr < section_end <= load_end
-                            ):
-                                return True
-                except (ValueError, IndexError):
-                    pass
-        i += 1
-
-    return False
+    st = binary_path.stat()
+    key = (str(binary_path), st.st_mtime_ns, st.st_size)
+    bounds = _pt_load_bounds.get(key)
+    if bounds is None:
+        ranges = sorted(
+            (phdr.p_vaddr, phdr.p_vaddr + phdr.p_memsz)
+            for phdr in iter_program_headers(data, ehdr)
+            if phdr.p_type == PT_LOAD
+        )
+        bounds = ([r[0] for r in ranges], [r[1] for r in ranges])
+        _pt_load_bounds[key] = bounds
 
+    # The section is mapped if its first or last byte lies in a PT_LOAD
+    return _in_pt_load(bounds, shdr.sh_addr) or (
+        shdr.sh_size > 0 and _in_pt_load(bounds, shdr.sh_addr + shdr.sh_size - 1)
+    )
 
-@pytest.fixture(scope="module")
-def build_test_binaries():
-    """Build all C test binaries before running tests."""
-    test_cases = [
-        "test_zero_page_aligned",
-        "test_zero_page_unaligned_start",
-        "test_zero_page_unaligned_size",
-        "test_zero_page_both_unaligned",
-    ]
-
-    # Build each test binary
-    for test_name in test_cases:
-        source = TEST_DIR / f"{test_name}.c"
-        output = TEST_DIR / test_name
-
-        # Compile with page-aligned section
-        result = subprocess.run(
-            [
-                "gcc",
-                "-O0",
-                "-g",
-                "-o",
-                str(output),
-                str(source),
-                "-Wl,--section-start=.testdata=0x10000",
-            ],
-            capture_output=True,
-            text=True,
-        )
 
-        if result.returncode != 0:
-            pytest.fail(f"Failed to build {test_name}: {result.stderr}")
+def iter_program_headers(data: bytes, ehdr):
+    """Yield the program headers of a parsed ELF file."""
+    for i in range(ehdr.e_phnum):
+        yield read_program_header(data, ehdr.e_phoff + i * 56)
 
-    yield test_cases
 
-    # Cleanup built binaries and zeroed versions
-    for test_name in test_cases:
-        (TEST_DIR / test_name).unlink(missing_ok=True)
-        (TEST_DIR / f"{test_name}.zeroed").unlink(missing_ok=True)
+def find_sections(data: bytes, ehdr, names: set[str]) -> dict:
+    """Look up several sections in one pass, returning {name: shdr}."""
+    strtab = read_section_header(data, ehdr.e_shoff + ehdr.e_shstrndx * 64)
+    found = {}
+    for i in range(ehdr.e_shnum):
+        shdr = read_section_header(data, ehdr.e_shoff + i * 64)
+        name = get_section_name(data, strtab.sh_offset, shdr.sh_name)
+        if name in names:
+            found[name] = shdr
+    return found
 
 
-def run_binary(binary_path: Path) -> tuple[int, str, str]:
-    """Run a binary and return (exit_code, stdout, stderr)."""
-    result = subprocess.run(
-        [str(binary_path)],
-        capture_output=True,
-        text=True,
-    )
-    return result.returncode, result.stdout, result.stderr
+def find_rela_at(data: bytes, ehdr, vaddr: int):
+    """Return the RELA entry relocating vaddr, or None if there is none."""
+    for i in range(ehdr.e_shnum):
+        shdr = read_section_header(data, ehdr.e_shoff + i * 64)
+        if shdr.sh_type != SHT_RELA:
+            continue
+        for offset in range(shdr.sh_offset, shdr.sh_offset + shdr.sh_size, 24):
+            rela = read_rela_entry(data, offset)
+            if rela.r_offset == vaddr:
+                return rela
+    return None
 
 
 def apply_zero_page(input_path: Path, output_path: Path) -> tuple[int, str]:
@@ -180,22 +155,31 @@ def apply_zero_page(input_path: Path, output_path: Path) -> tuple[int, str]:
 
     Returns: (exit_code, output)
     """
-    import io
-    import sys
-
-    # Capture stdout
-    old_stdout = sys.stdout
-    sys.stdout = output_buffer = io.StringIO()
-
-    try:
+    # Called from module-scoped fixtures, which cannot use capsys
+    with contextlib.redirect_stdout(io.StringIO()) as output_buffer:
         exit_code = main(
             ["zero-page", str(input_path), str(output_path), "--section=.testdata"]
         )
-        output = output_buffer.getvalue()
-    finally:
-        sys.stdout = old_stdout
+    return exit_code, output_buffer.getvalue()
 
-    return exit_code, output
+
+def _zero_page_once(input_bin: Path):
+    """Zero-page a test binary and return (input_bin, output_bin, exit_code, output)."""
+    output_bin = input_bin.with_name(f"{input_bin.name}.zeroed")
+    exit_code, output = apply_zero_page(input_bin, output_bin)
+    return input_bin, output_bin, exit_code, output
+
+
+@pytest.fixture(scope="module")
+def zeroed_aligned(build_test_binaries):
+    """test_zero_page_aligned after zero-paging, shared across tests."""
+    return _zero_page_once(build_test_binaries["test_zero_page_aligned"])
+
+
+@pytest.fixture(scope="module")
+def zeroed_unaligned_size(build_test_binaries):
+    """test_zero_page_unaligned_size after zero-paging, shared across tests."""
+    return _zero_page_once(build_test_binaries["test_zero_page_unaligned_size"])
 
 
 def test_tool_exists():
@@ -204,22 +188,19 @@ def test_tool_exists():
     assert main is not None
 
 
-def test_aligned_case(build_test_binaries):
+def test_aligned_case(zeroed_aligned, run_binary):
     """
     Test zero-page optimization with fully aligned section.
 
     Expected: Entire section should be zero-paged.
     """
-    test_name = "test_zero_page_aligned"
-    input_bin = TEST_DIR / test_name
-    output_bin = TEST_DIR / f"{test_name}.zeroed"
+    input_bin, output_bin, exit_code, output = zeroed_aligned
 
     # Verify original binary works
-    exit_code, stdout, stderr = run_binary(input_bin)
-    assert exit_code != 0, "Original binary should fail (no zero-paging yet)"
+    original_exit_code, _, _ = run_binary(input_bin)
+    assert original_exit_code != 0, "Original binary should fail (no zero-paging yet)"
 
-    # Apply zero-page optimization
-    exit_code, output = apply_zero_page(input_bin, output_bin)
+    # Check the zero-page optimization result
     assert exit_code == 0, f"Zero-page tool failed: {output}"
     assert output_bin.exists(), "Output binary not created"
 
@@ -230,19 +211,14 @@ def test_aligned_case(build_test_binaries):
     assert "zero-paged" in stdout.lower(), "Should confirm zero-paging worked"
 
 
-def test_unaligned_size_case(build_test_binaries):
+def test_unaligned_size_case(zeroed_unaligned_size, run_binary):
     """
     Test zero-page optimization with page-aligned start but unaligned size.
 
     This is the critical case for .hip_fatbin which has partial pages at the end.
     Expected: Full pages zero-paged, partial page preserved.
     """
-    test_name = "test_zero_page_unaligned_size"
-    input_bin = TEST_DIR / test_name
-    output_bin = TEST_DIR / f"{test_name}.zeroed"
-
-    # Apply zero-page optimization
-    exit_code, output = apply_zero_page(input_bin, output_bin)
+    _, output_bin, exit_code, output = zeroed_unaligned_size
     assert exit_code == 0, f"Zero-page tool failed: {output}"
 
     # Check that it reports saving space but keeping partial page
@@ -257,14 +233,9 @@ def test_unaligned_size_case(build_test_binaries):
     assert "Partial page preserved" in stdout, "Should confirm partial page kept"
 
 
-def test_file_size_reduction(build_test_binaries):
+def test_file_size_reduction(zeroed_aligned):
     """Verify that zero-paging actually reduces file size."""
-    test_name = "test_zero_page_aligned"
-    input_bin = TEST_DIR / test_name
-    output_bin = TEST_DIR / f"{test_name}.zeroed"
-
-    # Apply zero-page
-    exit_code, output = apply_zero_page(input_bin, output_bin)
+    input_bin, output_bin, exit_code, output = zeroed_aligned
     assert exit_code == 0
 
     # Check file sizes
@@ -278,33 +249,20 @@ def test_file_size_reduction(build_test_binaries):
     assert saved >= 4096, f"Should save at least 4KB, saved {saved} bytes"
 
 
-def test_binary_still_executable(build_test_binaries):
+def test_binary_still_executable(zeroed_unaligned_size, elf_info):
     """Verify zeroed binaries are still valid executables."""
-    test_name = "test_zero_page_unaligned_size"
-    input_bin = TEST_DIR / test_name
-    output_bin = TEST_DIR / f"{test_name}.zeroed"
-
-    # Apply zero-page
-    exit_code, output = apply_zero_page(input_bin, output_bin)
+    _, output_bin, exit_code, output = zeroed_unaligned_size
     assert exit_code == 0
 
-    # Check with readelf that it's still a valid ELF
-    result = subprocess.run(
-        ["readelf", "-h", str(output_bin)],
-        capture_output=True,
-        text=True,
-    )
-    assert result.returncode == 0, "readelf should succeed on zeroed binary"
-    assert "ELF64" in result.stdout, "Should be a valid ELF64 binary"
+    # Check that it's still a valid ELF
+    elf_class, interp, _ = elf_info(output_bin)
+    assert elf_class == 64, "Should be a valid ELF64 binary"
+    assert interp is not None, "Should still have an interpreter"
 
 
-def test_tool_reports_savings(build_test_binaries):
+def test_tool_reports_savings(zeroed_aligned):
     """Verify the tool reports accurate file size savings."""
-    test_name = "test_zero_page_aligned"
-    input_bin = TEST_DIR / test_name
-    output_bin = TEST_DIR / f"{test_name}.zeroed"
-
-    exit_code, output = apply_zero_page(input_bin, output_bin)
+    _, _, exit_code, output = zeroed_aligned
     assert exit_code == 0
 
     # Check that output includes size information
@@ -314,23 +272,17 @@ def test_tool_reports_savings(build_test_binaries):
     assert "bytes" in output
 
     # Parse the saved bytes
-    import re
-
-    match = re.search(r"Saved: ([\d,]+) bytes", output)
+    match = _SAVED_RE.search(output)
     assert match, "Should report saved bytes"
     saved_bytes = int(match.group(1).replace(",", ""))
     assert saved_bytes == 4096, "Should save exactly 4096 bytes (1 page)"
 
 
-def test_nonexistent_section(build_test_binaries):
+def test_nonexistent_section(build_test_binaries, tmp_path):
     """Test that tool handles missing section gracefully."""
     # Use one of the test binaries
-    test_name = "test_zero_page_aligned"
-    input_bin = TEST_DIR / test_name
-    output_bin = TEST_DIR / "test_nonexistent.zeroed"
-
-    # Clean up any existing output file from previous runs
-    output_bin.unlink(missing_ok=True)
+    input_bin = build_test_binaries["test_zero_page_aligned"]
+    output_bin = tmp_path / "test_nonexistent.zeroed"
 
     # Call tool with a section that doesn't exist
     exit_code = main(
@@ -355,16 +307,13 @@ def test_all_cases_pass(build_test_binaries):
     Note: Some tests may behave differently than expected due to linker
     behavior (see README.md), but should still execute successfully.
     """
-    for test_name in build_test_binaries:
-        input_bin = TEST_DIR / test_name
-        output_bin = TEST_DIR / f"{test_name}.zeroed"
-
-        # Skip if already tested individually
+    for test_name, input_bin in build_test_binaries.items():
+        # Skip if already covered by the shared zeroed_* fixtures
         if test_name in ["test_zero_page_aligned", "test_zero_page_unaligned_size"]:
             continue
 
         # Apply zero-page
-        exit_code, output = apply_zero_page(input_bin, output_bin)
+        _, output_bin, exit_code, output = _zero_page_once(input_bin)
 
         # Tool should succeed
         assert exit_code == 0, f"Tool failed for {test_name}: {output}"
@@ -383,97 +332,33 @@ def test_all_cases_pass(build_test_binaries):
 # ============================================================================
 
 
-@pytest.fixture(scope="module")
-def build_mapped_section_test():
-    """Build the test_mapped_section binary."""
-    source = TEST_DIR / "test_mapped_section.c"
-    output = TEST_DIR / "test_mapped_section"
-    custom_data_file = TEST_DIR / "custom_data.bin"
-
-    # Create custom data file with test string
-    test_string = b"Hello from mapped section!\x00"
-    custom_data_file.write_bytes(test_string)
-
-    # Compile as PIE (Position Independent Executable) - the common case
-    # Most modern executables are PIE, and all shared libraries are position-independent
-    # Tests use auto-allocated addresses which work with PIE's relative addressing
-    result = subprocess.run(
-        [
-            "gcc",
-            "-O0",
-            "-g",
-            "-o",
-            str(output),
-            str(source),
-        ],
-        capture_output=True,
-        text=True,
-    )
-
-    if result.returncode != 0:
-        pytest.fail(f"Failed to build test_mapped_section: {result.stderr}")
-
-    # Add custom section using objcopy (without ALLOC flag)
-    # This creates a section that exists in the ELF file but is NOT mapped to memory
-    result = subprocess.run(
-        [
-            "objcopy",
-            "--add-section",
-            f".custom_data={str(custom_data_file)}",
-            "--set-section-flags",
-            ".custom_data=contents,readonly",
-            str(output),
-        ],
-        capture_output=True,
-        text=True,
-    )
-
-    if result.returncode != 0:
-        pytest.fail(f"Failed to add custom section: {result.stderr}")
-
-    yield output
-
-    # Cleanup
-    output.unlink(missing_ok=True)
-    custom_data_file.unlink(missing_ok=True)
-    (TEST_DIR / "test_mapped_section.mapped").unlink(missing_ok=True)
-
-
-def test_map_section_basic(build_mapped_section_test, toolchain):
+def test_map_section_basic(
+    build_mapped_section_test, toolchain, elf_cache, tmp_path, capsys
+):
     """
     Test basic section mapping to new PT_LOAD with auto-allocation.
 
     This verifies that a section can be mapped to a new virtual address range
     using auto-allocated addresses (works with PIE binaries).
     """
-    import io
-    import sys
-
     input_bin = build_mapped_section_test
-    output_bin = TEST_DIR / "test_mapped_section.step1"
+    output_bin = tmp_path / "test_mapped_section.step1"
 
     # PRE-CONDITION: Verify .custom_data is NOT in a PT_LOAD before mapping
     assert not is_section_in_pt_load(
-        input_bin, ".custom_data"
+        input_bin, ".custom_data", elf_cache
     ), ".custom_data should NOT be in PT_LOAD before mapping (section should not have ALLOC flag)"
 
-    # Capture stdout
-    old_stdout = sys.stdout
-    sys.stdout = output_buffer = io.StringIO()
-
-    try:
-        # Map section with auto-allocated address (no --vaddr specified)
-        exit_code = main(
-            [
-                "map-section",
-                str(input_bin),
-                str(output_bin),
-                "--section=.custom_data",
-            ]
-        )
-        output = output_buffer.getvalue()
-    finally:
-        sys.stdout = old_stdout
+    # Map section with auto-allocated address (no --vaddr specified)
+    exit_code = main(
+        [
+            "map-section",
+            str(input_bin),
+            str(output_bin),
+            "--section=.custom_data",
+        ]
+    )
+    output = capsys.readouterr().out
 
     assert exit_code == 0, f"map-section failed: {output}"
     assert output_bin.exists(), "Output binary not created"
@@ -483,7 +368,7 @@ def test_map_section_basic(build_mapped_section_test, toolchain):
 
     # POST-CONDITION: Verify .custom_data IS now in a PT_LOAD
     assert is_section_in_pt_load(
-        output_bin, ".custom_data"
+        output_bin, ".custom_data", elf_cache
     ), ".custom_data should be in PT_LOAD after mapping"
 
     # Use get_section_vaddr to retrieve the auto-allocated address
@@ -492,20 +377,15 @@ def test_map_section_basic(build_mapped_section_test, toolchain):
         mapped_vaddr is not None
     ), ".custom_data should have a virtual address after mapping"
 
-    # Verify with readelf that new PT_LOAD exists at the mapped address
-    result = subprocess.run(
-        ["readelf", "-l", str(output_bin)],
-        capture_output=True,
-        text=True,
-    )
-    hex_addr = f"{mapped_vaddr:016x}"
-    assert hex_addr in result.stdout, f"Should have PT_LOAD at 0x{hex_addr}"
-
-    # Cleanup
-    output_bin.unlink(missing_ok=True)
+    # Verify that a new PT_LOAD exists at the mapped address
+    data, ehdr = elf_cache(output_bin)
+    assert any(
+        phdr.p_type == PT_LOAD and phdr.p_vaddr == mapped_vaddr
+        for phdr in iter_program_headers(data, ehdr)
+    ), f"Should have PT_LOAD at 0x{mapped_vaddr:x}"
 
 
-def test_set_pointer_basic(build_mapped_section_test, toolchain):
+def test_set_pointer_basic(build_mapped_section_test, elf_cache, tmp_path, capsys):
     """
     Test set-pointer command with auto-allocated section address.
 
@@ -514,77 +394,41 @@ def test_set_pointer_basic(build_mapped_section_test, toolchain):
     2. Set pointer to the mapped section
     3. Verify pointer was written and relocation updated (PIE binaries)
     """
-    import io
-    import sys
-    import struct
-
     input_bin = build_mapped_section_test
-    mapped_bin = TEST_DIR / "test_mapped_section.set_pointer_mapped"
-    output_bin = TEST_DIR / "test_mapped_section.set_pointer"
+    mapped_bin = tmp_path / "test_mapped_section.set_pointer_mapped"
+    output_bin = tmp_path / "test_mapped_section.set_pointer"
 
     # Step 1: Map .custom_data section (auto-allocate address)
-    exit_code = main(
-        [
-            "map-section",
-            str(input_bin),
-            str(mapped_bin),
-            "--section=.custom_data",
-            "--quiet",
-        ]
+    target_vaddr = map_section_to_new_load(
+        input_bin, mapped_bin, ".custom_data", verbose=False
     )
-    assert exit_code == 0, "map-section failed"
-
-    # Get the auto-allocated address
-    target_vaddr = get_section_vaddr(toolchain, mapped_bin, ".custom_data")
-    assert target_vaddr is not None, ".custom_data should be mapped"
+    assert target_vaddr is not None, "map-section failed"
 
     # Find .test_wrapper section address and file offset
-    result = subprocess.run(
-        ["readelf", "-S", str(mapped_bin)],
-        capture_output=True,
-        text=True,
-    )
-
-    wrapper_vaddr = None
-    wrapper_offset = None
-    lines = result.stdout.split("\n")
-    for i, line in enumerate(lines):
-        if ".test_wrapper" in line:
-            parts = line.split()
-            if len(parts) >= 5:
-                wrapper_vaddr = int(parts[3], 16)  # Address column
-                wrapper_offset = int(parts[4], 16)  # Offset column
-                break
-
-    if wrapper_vaddr is None:
+    mapped_data, ehdr = elf_cache(mapped_bin)
+    found = find_section_by_name(mapped_data, ehdr, ".test_wrapper")
+    if found is None:
         pytest.skip(".test_wrapper section not found")
+    _, wrapper_shdr = found
 
     # The data_ptr field is at offset +8 in the structure
-    pointer_vaddr = wrapper_vaddr + 8
-    pointer_offset = wrapper_offset + 8
+    pointer_vaddr = wrapper_shdr.sh_addr + 8
+    pointer_offset = wrapper_shdr.sh_offset + 8
 
     # Read original pointer value
-    mapped_data = mapped_bin.read_bytes()
-    original_ptr = struct.unpack_from("<Q", mapped_data, pointer_offset)[0]
+    (original_ptr,) = _U64_LE.unpack_from(mapped_data, pointer_offset)
 
     # Step 2: Set pointer to the mapped section
-    # Capture stdout
-    old_stdout = sys.stdout
-    sys.stdout = output_buffer = io.StringIO()
-
-    try:
-        exit_code = main(
-            [
-                "set-pointer",
-                str(mapped_bin),
-                str(output_bin),
-                f"--at=0x{pointer_vaddr:x}",
-                f"--target=0x{target_vaddr:x}",
-            ]
-        )
-        output = output_buffer.getvalue()
-    finally:
-        sys.stdout = old_stdout
+    exit_code = main(
+        [
+            "set-pointer",
+            str(mapped_bin),
+            str(output_bin),
+            f"--at=0x{pointer_vaddr:x}",
+            f"--target=0x{target_vaddr:x}",
+        ]
+    )
+    output = capsys.readouterr().out
 
     assert exit_code == 0, f"set-pointer failed: {output}"
     assert output_bin.exists(), "Output binary not created"
@@ -594,8 +438,7 @@ def test_set_pointer_basic(build_mapped_section_test, toolchain):
     assert "Successfully set pointer" in output
 
     # Step 3: Verify the pointer value was actually written to the file
-    output_data = output_bin.read_bytes()
-    written_ptr = struct.unpack_from("<Q", output_data, pointer_offset)[0]
+    written_ptr = _read_u64(output_bin, pointer_offset)
 
     assert (
         written_ptr == target_vaddr
@@ -606,27 +449,17 @@ def test_set_pointer_basic(build_mapped_section_test, toolchain):
 
     # Check if relocation was mentioned in output (indicates PIE binary with relocations)
     if "Updated relocation" in output:
-        # Relocation was found and updated - verify with readelf
-        result = subprocess.run(
-            ["readelf", "-r", str(output_bin)],
-            capture_output=True,
-            text=True,
-        )
-        # Look for relocation at our pointer address
-        hex_addr = f"{pointer_vaddr:x}"
-        assert (
-            hex_addr in result.stdout.lower()
-        ), "Relocation should exist at pointer address"
+        # Relocation was found and updated - verify it in the output binary
+        data, ehdr = elf_cache(output_bin)
+        rela = find_rela_at(data, ehdr, pointer_vaddr)
+        assert rela is not None, "Relocation should exist at pointer address"
+        assert rela.r_addend == target_vaddr, "Relocation addend should be updated"
     elif "No relocation found" in output:
         # This is OK for non-PIE binaries
         pass
 
-    # Cleanup
-    mapped_bin.unlink(missing_ok=True)
-    output_bin.unlink(missing_ok=True)
 
-
-def test_set_pointer_requires_relocation_for_pie(build_mapped_section_test):
+def test_set_pointer_requires_relocation_for_pie(build_mapped_section_test, tmp_path):
     """
     Test that set-pointer fails for PIE binary without relocation.
 
@@ -634,33 +467,29 @@ def test_set_pointer_requires_relocation_for_pie(build_mapped_section_test):
     rather than creating binaries that will crash at runtime.
     """
     input_bin = build_mapped_section_test
-    output_bin = TEST_DIR / "test_should_fail"
+    output_bin = tmp_path / "test_should_fail"
 
     # Try to set pointer at a location that has no relocation
     # Use an address in .rodata or another section without relocations
     # For this test, we'll use an arbitrary address that's valid but has no relocation
-    exit_code = main(
-        [
-            "set-pointer",
-            str(input_bin),
-            str(output_bin),
-            "--at=0x2100",  # Address in .rodata (read-only data, no relocations)
-            "--target=0x5000",
-            "--quiet",
-        ]
+    success = set_pointer(
+        input_bin,
+        output_bin,
+        pointer_vaddr=0x2100,  # Address in .rodata (read-only data, no relocations)
+        target_vaddr=0x5000,
+        verbose=False,
     )
 
     # Should fail for PIE binary without relocation
     assert (
-        exit_code != 0
+        not success
     ), "Should fail when setting pointer without relocation in PIE binary"
     assert not output_bin.exists(), "Should not create output file on failure"
 
-    # Cleanup (in case test failed and file was created)
-    output_bin.unlink(missing_ok=True)
-
 
-def test_full_workflow_map_and_relocate(build_mapped_section_test, toolchain):
+def test_full_workflow_map_and_relocate(
+    build_mapped_section_test, elf_cache, tmp_path, run_binary
+):
     """
     Test complete workflow with auto-allocated addresses (PIE-compatible).
 
@@ -670,70 +499,43 @@ def test_full_workflow_map_and_relocate(build_mapped_section_test, toolchain):
     3. Verify binary executes and can read from mapped section
     """
     input_bin = build_mapped_section_test
-    step1_bin = TEST_DIR / "test_mapped_section.step1"
-    final_bin = TEST_DIR / "test_mapped_section.mapped"
+    step1_bin = tmp_path / "test_mapped_section.step1"
+    final_bin = tmp_path / "test_mapped_section.mapped"
 
     # PRE-CONDITION: Verify .custom_data is NOT in a PT_LOAD before mapping
     assert not is_section_in_pt_load(
-        input_bin, ".custom_data"
+        input_bin, ".custom_data", elf_cache
     ), ".custom_data should NOT be in PT_LOAD before mapping"
 
     # Step 1: Map .custom_data to new PT_LOAD (auto-allocate address)
-    exit_code = main(
-        [
-            "map-section",
-            str(input_bin),
-            str(step1_bin),
-            "--section=.custom_data",
-            "--quiet",
-        ]
+    target_vaddr = map_section_to_new_load(
+        input_bin, step1_bin, ".custom_data", verbose=False
     )
-
-    assert exit_code == 0, "map-section failed"
+    assert target_vaddr is not None, "map-section failed"
 
     # POST-CONDITION: Verify .custom_data IS now in a PT_LOAD
     assert is_section_in_pt_load(
-        step1_bin, ".custom_data"
+        step1_bin, ".custom_data", elf_cache
     ), ".custom_data should be in PT_LOAD after mapping"
 
-    # Get the auto-allocated address
-    target_vaddr = get_section_vaddr(toolchain, step1_bin, ".custom_data")
-    assert target_vaddr is not None, ".custom_data should be mapped"
-
     # Step 2: Find .test_wrapper address and set pointer to mapped section
-    result = subprocess.run(
-        ["readelf", "-S", str(step1_bin)],
-        capture_output=True,
-        text=True,
-    )
-
-    # Parse to find .test_wrapper virtual address
-    wrapper_vaddr = None
-    for line in result.stdout.split("\n"):
-        if ".test_wrapper" in line:
-            parts = line.split()
-            if len(parts) >= 4:
-                addr_str = parts[3]
-                wrapper_vaddr = int(addr_str, 16)
-                break
-
-    if wrapper_vaddr is None:
+    step1_data, ehdr = elf_cache(step1_bin)
+    sections = find_sections(step1_data, ehdr, {".custom_data", ".test_wrapper"})
+    assert (
+        sections[".custom_data"].sh_addr == target_vaddr
+    ), "map-section should report the address .custom_data was mapped at"
+    if ".test_wrapper" not in sections:
         pytest.skip(".test_wrapper section not found")
 
-    pointer_vaddr = wrapper_vaddr + 8  # data_ptr field offset
-
-    exit_code = main(
-        [
-            "set-pointer",
-            str(step1_bin),
-            str(final_bin),
-            f"--at=0x{pointer_vaddr:x}",
-            f"--target=0x{target_vaddr:x}",
-            "--quiet",
-        ]
-    )
+    pointer_vaddr = sections[".test_wrapper"].sh_addr + 8  # data_ptr field offset
 
-    assert exit_code == 0, "set-pointer failed"
+    assert set_pointer(
+        step1_bin,
+        final_bin,
+        pointer_vaddr=pointer_vaddr,
+        target_vaddr=target_vaddr,
+        verbose=False,
+    ), "set-pointer failed"
 
     # Step 3: Execute final binary
     exit_code, stdout, stderr = run_binary(final_bin)
@@ -746,12 +548,10 @@ def test_full_workflow_map_and_relocate(build_mapped_section_test, toolchain):
     assert "SUCCESS" in stdout, "Should report success"
     assert "Hello from mapped section!" in stdout, "Should read mapped data"
 
-    # Cleanup
-    step1_bin.unlink(missing_ok=True)
-    final_bin.unlink(missing_ok=True)
 
-
-def test_preserves_pt_interp_when_expanding_phdr(build_mapped_section_test):
+def test_preserves_pt_interp_when_expanding_phdr(
+    build_mapped_section_test, elf_info, tmp_path
+):
     """
     Test that PT_INTERP is preserved when PHDR table expansion is required.
 
@@ -766,46 +566,24 @@ def test_preserves_pt_interp_when_expanding_phdr(build_mapped_section_test):
     The fix ensures min_content_offset accounts for data referenced by program
     headers (like PT_INTERP), not just section headers.
 
-    This test uses the test_mapped_section binary which, after being built with
-    custom_data.bin mapped in, has a layout that triggers PHDR expansion when
-    zero-paging is applied.
+    This test uses the test_mapped_section binary whose unmapped .custom_data
+    section, once mapped in, produces a layout that triggers PHDR expansion
+    when zero-paging is applied.
     """
-    # Use the test binary
-    input_bin = TEST_DIR / "test_mapped_section"
-    output_bin = TEST_DIR / "test_interp_preserved.bin"
-
-    # Map .custom_data to a new PT_LOAD (triggers PHDR expansion)
-    # First we need to ensure the binary is built and has custom_data mapped
-    if not input_bin.exists():
-        pytest.skip("test_mapped_section binary not built")
-
-    exit_code = main(
-        [
-            "map-section",
-            str(input_bin),
-            str(output_bin),
-            "--section=.custom_data",  # This will trigger PHDR table expansion
-            "--quiet",
-        ]
-    )
-
-    assert exit_code == 0, "map-section should succeed"
-
-    # Verify PT_INTERP is intact using readelf
-    result = subprocess.run(
-        ["readelf", "-l", str(output_bin)], capture_output=True, text=True
-    )
-
-    assert result.returncode == 0, "readelf should succeed"
+    input_bin = build_mapped_section_test
+    output_bin = tmp_path / "test_interp_preserved.bin"
 
-    # Check for correct interpreter path
+    # Mapping .custom_data triggers PHDR table expansion
     assert (
-        "/lib64/ld-linux-x86-64.so.2" in result.stdout
-    ), "PT_INTERP should contain correct interpreter path"
+        map_section_to_new_load(input_bin, output_bin, ".custom_data", verbose=False)
+        is not None
+    ), "map-section should succeed"
 
-    # Should NOT contain corrupted data like "P<E5>td"
-    assert "P�td" not in result.stdout, "PT_INTERP should not be corrupted"
-    assert "P<E5>td" not in result.stdout, "PT_INTERP should not be corrupted"
+    # Verify PT_INTERP is intact (not overwritten with e.g. "P<E5>td")
+    _, interp, _ = elf_info(output_bin)
+    assert (
+        interp == "/lib64/ld-linux-x86-64.so.2"
+    ), f"PT_INTERP should contain correct interpreter path, got {interp!r}"
 
     # Verify ldd can read the binary (comprehensive check)
     ldd_result = subprocess.run(
@@ -824,6 +602,3 @@ def test_preserves_pt_interp_when_expanding_phdr(build_mapped_section_test):
     assert (
         "�" not in ldd_result.stdout
     ), "ldd output should not contain corrupted unicode"
-
-    # Cleanup
-    output_bin.unlink(missing_ok=True)
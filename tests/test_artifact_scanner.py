@@ -1,6 +1,9 @@
 """Unit tests for artifact scanner functionality."""
 
-import shutil
+import os
+import re
+import stat
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from typing import Iterator
 
@@ -15,6 +18,17 @@ from rocm_kpack.artifact_scanner import (
     KernelDatabase,
     RecognizerRegistry,
 )
+from rocm_kpack.artifact_utils import copy_file
+
+
+# Kernel file names look like kernel_gfx1100.hsaco or kernel_gfx1100_foo.dat
+_KERNEL_STEM = re.compile(r"kernel_(gfx[^_.]+)")
+
+# Artifact type by file suffix; anything else is metadata
+_SUFFIX_TO_TYPE = {".hsaco": "hsaco"}
+
+# Neutral on SSDs, and DirEntry.inode() costs a stat per entry on Windows
+_INODE_SORT = os.environ.get("KPACK_INODE_SORT") == "1"
 
 
 # Dummy database implementation for testing
@@ -25,30 +39,55 @@ class DummyKernelDatabase(KernelDatabase):
     architecture-specific kernel files.
     """
 
+    def __init__(self, artifact_path: ArtifactPath):
+        super().__init__(artifact_path)
+        self._artifacts_cache: tuple[KernelArtifact, ...] | None = None
+
+    def _iter_parsed(self) -> Iterator[tuple[str, str, str]]:
+        """Yield (name, gfx_target, artifact_type) for each kernel file.
+
+        Uses os.scandir so the file-type check comes from the directory entry
+        rather than a separate stat() per file. With KPACK_INODE_SORT=1 the
+        entries are visited in inode order, which approximates on-disk order
+        and cuts seeks on rotational media.
+        """
+        with os.scandir(self.absolute_path) as it:
+            entries = list(it)
+        if _INODE_SORT:
+            entries.sort(key=lambda e: e.inode())
+        for entry in entries:
+            if not entry.is_file(follow_symlinks=False):
+                continue
+            # Extract gfx target from filename like kernel_gfx1100.hsaco
+            m = _KERNEL_STEM.match(entry.name)
+            if m:
+                _, dot, ext = entry.name.rpartition(".")
+                artifact_type = _SUFFIX_TO_TYPE.get(dot + ext, "metadata")
+                yield entry.name, m.group(1), artifact_type
+
+    def _artifacts(self) -> tuple[KernelArtifact, ...]:
+        """Parse the directory once and cache the resulting artifacts.
+
+        A tuple, so the cached artifacts can be handed out without copying.
+        """
+        if self._artifacts_cache is None:
+            self._artifacts_cache = tuple(
+                KernelArtifact(
+                    relative_path=Path(name),
+                    gfx_target=gfx_target,
+                    artifact_type=artifact_type,
+                )
+                for name, gfx_target, artifact_type in self._iter_parsed()
+            )
+        return self._artifacts_cache
+
     def get_architectures(self) -> list[str]:
         """Scan for gfx targets in filenames."""
-        architectures = set()
-        for item in self.absolute_path.iterdir():
-            if item.is_file() and item.stem.startswith("kernel_"):
-                # Extract gfx target from filename like kernel_gfx1100.hsaco
-                parts = item.stem.split("_")
-                if len(parts) >= 2 and parts[1].startswith("gfx"):
-                    architectures.add(parts[1])
-        return sorted(architectures)
+        return sorted({a.gfx_target for a in self._artifacts()})
 
     def get_kernel_artifacts(self) -> Iterator[KernelArtifact]:
-        """Yield kernel artifacts from this database."""
-        for item in self.absolute_path.iterdir():
-            if item.is_file() and item.stem.startswith("kernel_"):
-                parts = item.stem.split("_")
-                if len(parts) >= 2 and parts[1].startswith("gfx"):
-                    gfx_target = parts[1]
-                    artifact_type = "hsaco" if item.suffix == ".hsaco" else "metadata"
-                    yield KernelArtifact(
-                        relative_path=Path(item.name),
-                        gfx_target=gfx_target,
-                        artifact_type=artifact_type,
-                    )
+        """Iterate over kernel artifacts from this database."""
+        return iter(self._artifacts())
 
 
 class DummyDatabaseRecognizer(DatabaseRecognizer):
@@ -56,37 +95,98 @@ class DummyDatabaseRecognizer(DatabaseRecognizer):
 
     def can_recognize(self, artifact_path: ArtifactPath) -> bool:
         """Check if directory contains kernel.db marker."""
-        abs_path = artifact_path.absolute_path
-        return abs_path.is_dir() and (abs_path / "kernel.db").exists()
+        # The scanner's directory entry answers the type check for free
+        entry = artifact_path.dir_entry
+        if entry is not None and not entry.is_dir(follow_symlinks=False):
+            return False
+        # Otherwise a single stat of the marker also covers the is-a-directory
+        # check: it fails with ENOTDIR when the candidate is a regular file.
+        # Resolve it relative to the parent directory when the scanner holds
+        # that open, rather than walking the absolute path.
+        try:
+            if artifact_path.parent_dir_fd is not None:
+                st = os.stat(
+                    os.path.join(artifact_path.relative_path.name, "kernel.db"),
+                    dir_fd=artifact_path.parent_dir_fd,
+                )
+            else:
+                st = os.stat(os.path.join(artifact_path.absolute_path, "kernel.db"))
+        except (FileNotFoundError, NotADirectoryError):
+            return False
+        return stat.S_ISREG(st.st_mode)
 
     def recognize(self, artifact_path: ArtifactPath) -> KernelDatabase | None:
-        """Create a DummyKernelDatabase if recognized."""
-        if not self.can_recognize(artifact_path):
-            return None
+        """Create a DummyKernelDatabase for a path accepted by can_recognize."""
+        # The registry only calls recognize() after can_recognize() returned
+        # True, and the marker check is all there is to validate
         return DummyKernelDatabase(artifact_path)
 
 
 # CopyVisitor implementation
 class CopyVisitor(ArtifactVisitor):
-    """Visitor that copies artifacts to an output directory."""
+    """Visitor that copies artifacts to an output directory.
+
+    Copies run on a thread pool; use it as a context manager (or call
+    close()) to wait for them to finish.
+    """
 
-    def __init__(self, output_root: Path):
+    def __init__(self, output_root: Path, max_workers: int = 8):
         """Initialize with output directory.
 
         Args:
             output_root: Root directory where artifacts will be copied
+            max_workers: Number of threads used for file copies
         """
         self.output_root = output_root
+        self._pool = ThreadPoolExecutor(max_workers)
+        self._futures: list[Future] = []
         self.visited_opaque_files: list[Path] = []
         self.visited_databases: list[Path] = []
         self.visited_bundled_binaries: list[Path] = []
+        self._created_dirs: set[str] = set()
+
+    def _ensure_dir(self, path: str | Path) -> None:
+        """Create a destination directory unless this visitor already has."""
+        path = os.fspath(path)
+        if path in self._created_dirs:
+            return
+        os.makedirs(path, exist_ok=True)
+        # Record the directory and its ancestors up to the output root, so
+        # later files in sibling or parent directories skip makedirs too
+        root = os.fspath(self.output_root)
+        while path not in self._created_dirs:
+            self._created_dirs.add(path)
+            if path == root:
+                break
+            parent = os.path.dirname(path)
+            if parent == path:
+                break
+            path = parent
+
+    def _copy(self, src: str | Path, dst: str | Path) -> None:
+        """Queue a file copy; directories must already exist."""
+        self._futures.append(self._pool.submit(copy_file, src, dst))
+
+    def close(self) -> None:
+        """Wait for queued copies, re-raising the first failure."""
+        try:
+            for future in self._futures:
+                future.result()
+        finally:
+            self._pool.shutdown()
+
+    def __enter__(self) -> "CopyVisitor":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
     def visit_opaque_file(self, artifact_path: ArtifactPath) -> None:
         """Copy opaque file preserving relative path structure."""
         self.visited_opaque_files.append(artifact_path.relative_path)
         dest = self.output_root / artifact_path.relative_path
-        dest.parent.mkdir(parents=True, exist_ok=True)
-        shutil.copy2(artifact_path.absolute_path, dest)
+        self._ensure_dir(dest.parent)
+        self._copy(artifact_path.absolute_path, dest)
 
     def visit_bundled_binary(self, artifact_path, bundled_binary) -> None:
         """Record bundled binary visits (not implemented for this test)."""
@@ -96,25 +196,44 @@ class CopyVisitor(ArtifactVisitor):
         """Copy kernel database artifacts."""
         self.visited_databases.append(artifact_path.relative_path)
 
+        # Resolve the database directories once; per-kernel paths are joined
+        # as strings rather than building Path objects for each artifact
+        src_dir = artifact_path.absolute_path
+        dest_dir = self.output_root / artifact_path.relative_path
+
         # Copy the database marker file
-        marker_src = artifact_path.absolute_path / "kernel.db"
-        marker_dest = self.output_root / artifact_path.relative_path / "kernel.db"
-        marker_dest.parent.mkdir(parents=True, exist_ok=True)
-        shutil.copy2(marker_src, marker_dest)
+        self._ensure_dir(dest_dir)
+        self._copy(src_dir / "kernel.db", dest_dir / "kernel.db")
 
-        # Copy kernel artifacts
+        # Copy kernel artifacts. dest_dir already exists, so only kernels in
+        # subdirectories of the database need a directory created.
         for kernel in database.get_kernel_artifacts():
-            src = artifact_path.absolute_path / kernel.relative_path
-            dest = self.output_root / artifact_path.relative_path / kernel.relative_path
-            dest.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(src, dest)
+            rel = os.fspath(kernel.relative_path)
+            src = os.path.join(src_dir, rel)
+            dest = os.path.join(dest_dir, rel)
+            if os.sep in rel:
+                self._ensure_dir(os.path.dirname(dest))
+            self._copy(src, dest)
+
+
+def _snapshot(root: Path) -> dict[str, bytes]:
+    """Read every file under root in one walk, keyed by POSIX relative path."""
+    snap = {}
+    for dirpath, _, filenames in os.walk(root):
+        rel_dir = Path(dirpath).relative_to(root)
+        for name in filenames:
+            snap[(rel_dir / name).as_posix()] = Path(dirpath, name).read_bytes()
+    return snap
 
 
 # Tests
-@pytest.fixture
-def test_tree(tmp_path: Path) -> Path:
+@pytest.fixture(scope="module")
+def test_tree(tmp_path_factory: pytest.TempPathFactory) -> Path:
     """Create a test directory tree with opaque files and a dummy database.
 
+    Built once per module; tests only read it and write their outputs
+    elsewhere.
+
     Structure:
         root/
             file1.txt
@@ -129,8 +248,7 @@ def test_tree(tmp_path: Path) -> Path:
                     kernel_gfx1100.dat
             file4.log
     """
-    root = tmp_path / "test_root"
-    root.mkdir()
+    root = tmp_path_factory.mktemp("test_root")
 
     # Opaque files
     (root / "file1.txt").write_text("content1")
@@ -160,30 +278,23 @@ def test_copy_visitor_copies_tree_correctly(test_tree: Path, tmp_path: Path):
     registry.register(DummyDatabaseRecognizer())
 
     scanner = ArtifactScanner(registry, toolchain=None)
-    visitor = CopyVisitor(output_dir)
-
     # Execute
-    scanner.scan_tree(test_tree, visitor)
+    with CopyVisitor(output_dir) as visitor:
+        scanner.scan_tree(test_tree, visitor)
+
+    snap = _snapshot(output_dir)
 
     # Verify opaque files were copied
-    assert (output_dir / "file1.txt").read_text() == "content1"
-    assert (output_dir / "subdir1" / "file2.txt").read_text() == "content2"
-    assert (output_dir / "subdir1" / "file3.dat").read_text() == "content3"
-    assert (output_dir / "file4.log").read_text() == "content4"
+    assert snap["file1.txt"] == b"content1"
+    assert snap["subdir1/file2.txt"] == b"content2"
+    assert snap["subdir1/file3.dat"] == b"content3"
+    assert snap["file4.log"] == b"content4"
 
     # Verify database was copied
-    assert (output_dir / "subdir2" / "kernels" / "kernel.db").read_text() == (
-        "database marker"
-    )
-    assert (
-        output_dir / "subdir2" / "kernels" / "kernel_gfx1100.hsaco"
-    ).read_text() == ("gfx1100 kernel code")
-    assert (
-        output_dir / "subdir2" / "kernels" / "kernel_gfx1201.hsaco"
-    ).read_text() == ("gfx1201 kernel code")
-    assert (output_dir / "subdir2" / "kernels" / "kernel_gfx1100.dat").read_text() == (
-        "gfx1100 metadata"
-    )
+    assert snap["subdir2/kernels/kernel.db"] == b"database marker"
+    assert snap["subdir2/kernels/kernel_gfx1100.hsaco"] == b"gfx1100 kernel code"
+    assert snap["subdir2/kernels/kernel_gfx1201.hsaco"] == b"gfx1201 kernel code"
+    assert snap["subdir2/kernels/kernel_gfx1100.dat"] == b"gfx1100 metadata"
 
     # Verify visitor tracking
     assert Path("file1.txt") in visitor.visited_opaque_files
@@ -233,6 +344,9 @@ def test_database_kernel_artifacts(test_tree: Path):
 
     artifacts = list(db.get_kernel_artifacts())
     assert len(artifacts) == 3
+    # Repeated calls list the same artifacts
+    assert list(db.get_kernel_artifacts()) == artifacts
+    assert db.get_architectures() == ["gfx1100", "gfx1201"]
 
     # Check that we have the expected artifacts
     artifact_paths = {a.relative_path for a in artifacts}
@@ -245,19 +359,20 @@ def test_database_kernel_artifacts(test_tree: Path):
     assert gfx_targets == {"gfx1100", "gfx1201"}
 
 
-def test_scanner_does_not_double_visit_database_files(test_tree: Path):
+def test_scanner_does_not_double_visit_database_files(test_tree: Path, tmp_path: Path):
     """Test that files inside a recognized database are not visited as opaque files."""
     registry = RecognizerRegistry()
     registry.register(DummyDatabaseRecognizer())
 
     scanner = ArtifactScanner(registry)
-    visitor = CopyVisitor(tmp_path := Path("/tmp/unused"))
-
-    scanner.scan_tree(test_tree, visitor)
+    with CopyVisitor(tmp_path / "output") as visitor:
+        scanner.scan_tree(test_tree, visitor)
 
     # Database files should NOT appear in opaque files list
+    forbidden = os.path.join("subdir2", "kernels")
     for opaque_path in visitor.visited_opaque_files:
-        assert not opaque_path.is_relative_to(Path("subdir2/kernels"))
+        rel = os.fspath(opaque_path)
+        assert rel != forbidden and not rel.startswith(forbidden + os.sep)
 
     # But database should be visited
     assert Path("subdir2/kernels") in visitor.visited_databases
@@ -4,6 +4,8 @@ Integration tests for the artifact splitter.
 These tests simulate real artifact splitting scenarios with mock data.
 """
 
+import mmap
+import os
 import shutil
 from argparse import Namespace
 from pathlib import Path
@@ -17,17 +19,143 @@ from rocm_kpack.artifact_splitter import (
     ExtractedKernel,
 )
 from rocm_kpack.artifact_utils import read_artifact_manifest, write_artifact_manifest
+from rocm_kpack.binutils import BinaryType, BundledBinary, UnbundledContents
 from rocm_kpack.database_handlers import RocBLASHandler
 from rocm_kpack.tools.split_artifacts import batch_split, parse_artifact_name
 from rocm_kpack.tools.verify_artifacts import ArtifactVerifier
 
 
+def _read_kpm(path: Path) -> dict:
+    """Decode a .kpm manifest from a read-only mapping of the file."""
+    with open(path, "rb") as f, mmap.mmap(
+        f.fileno(), 0, access=mmap.ACCESS_READ
+    ) as data:
+        return msgpack.unpackb(data, raw=False, use_list=False)
+
+
+def _bulk_write(files: list[tuple[Path, bytes]]) -> None:
+    """Write small files with raw fd calls, skipping Python's file objects."""
+    for path, data in files:
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, data)
+        finally:
+            os.close(fd)
+
+
+def _scan_arch_artifacts(output_dir: Path, artifact_prefix: str) -> list[Path]:
+    """List the architecture-specific artifact directories in one scandir pass."""
+    arch_prefix = f"{artifact_prefix}_gfx"
+    with os.scandir(output_dir) as it:
+        return sorted(
+            Path(entry.path)
+            for entry in it
+            if entry.name.startswith(arch_prefix)
+            and entry.is_dir(follow_symlinks=False)
+        )
+
+
+def _link_or_copy(src, dst, *, follow_symlinks=True):
+    """copytree copy_function that hardlinks, copying across filesystems."""
+    try:
+        os.link(src, dst, follow_symlinks=follow_symlinks)
+    except OSError:
+        shutil.copy2(src, dst, follow_symlinks=follow_symlinks)
+    return dst
+
+
+@pytest.fixture(scope="session")
+def cov5_binaries(test_assets_dir, tmp_path_factory):
+    """Session copy of the cov5 bundled test binaries.
+
+    Tests hardlink from this copy with _link_or_copy rather than copying the
+    binaries each time, and the pristine test_assets never share an inode
+    with a test's working tree.
+    """
+    mirror = tmp_path_factory.mktemp("cov5_binaries")
+    for name in ("libtest_kernel_multi.so", "libhost_only.so"):
+        shutil.copyfile(
+            test_assets_dir / "bundled_binaries/linux/cov5" / name, mirror / name
+        )
+    return mirror
+
+
+@pytest.fixture(scope="session")
+def test_artifact_templates(tmp_path_factory):
+    """Build test artifact trees once per session, keyed by their parameters.
+
+    Returns:
+        Function returning the template directory for a set of parameters
+    """
+    templates = {}
+
+    def _template(prefixes, files_per_prefix, include_fat_binaries, include_db_files):
+        key = (
+            tuple(prefixes),
+            files_per_prefix,
+            include_fat_binaries,
+            include_db_files,
+        )
+        if key in templates:
+            return templates[key]
+
+        artifact_dir = tmp_path_factory.mktemp("artifact_template")
+
+        # Write artifact manifest
+        write_artifact_manifest(artifact_dir, prefixes)
+
+        # Create prefix directories and collect the files to write
+        files = []
+        for prefix in prefixes:
+            lib_dir = artifact_dir / prefix / "lib"
+            db_dir = lib_dir / "rocblas" / "library"
+
+            # Create only the deepest directory; makedirs creates the rest
+            os.makedirs(db_dir if include_db_files else lib_dir)
+
+            # Create regular files
+            for i in range(files_per_prefix):
+                files.append(
+                    (lib_dir / f"libtest{i}.so", f"Mock library content {i}".encode())
+                )
+
+            # Optionally create fat binaries (mock)
+            if include_fat_binaries:
+                files.append(
+                    (lib_dir / "libfat.so", b"Mock fat binary with device code")
+                )
+                # Mark it for our tests
+                files.append((lib_dir / ".test_fat_marker", b"libfat.so"))
+
+            # Optionally create database files
+            if include_db_files:
+                # Create mock rocBLAS database files
+                files.append(
+                    (db_dir / "TensileLibrary_gfx1100.dat", b"Mock tensor data")
+                )
+                files.append(
+                    (db_dir / "TensileLibrary_gfx1100.co", b"Mock code object")
+                )
+                files.append((db_dir / "kernels.db", b"Mock kernel database"))
+
+        _bulk_write(files)
+
+        templates[key] = artifact_dir
+        return artifact_dir
+
+    return _template
+
+
 class TestArtifactSplitterIntegration:
     """Integration tests for the complete artifact splitting workflow."""
 
     @pytest.fixture
-    def create_test_artifact(self, tmp_path):
-        """Create a test artifact directory structure."""
+    def create_test_artifact(self, tmp_path, test_artifact_templates):
+        """Create a test artifact directory structure.
+
+        The tree is hardlinked from a per-session template, so the splitter
+        must treat its input as read-only (which it does).
+        """
 
         def _create(
             prefixes,
@@ -35,46 +163,11 @@ class TestArtifactSplitterIntegration:
             include_fat_binaries=False,
             include_db_files=False,
         ):
+            template = test_artifact_templates(
+                prefixes, files_per_prefix, include_fat_binaries, include_db_files
+            )
             artifact_dir = tmp_path / "test_artifact"
-            artifact_dir.mkdir()
-
-            # Write artifact manifest
-            write_artifact_manifest(artifact_dir, prefixes)
-
-            # Create prefix directories and files
-            for prefix in prefixes:
-                prefix_dir = artifact_dir / prefix
-                prefix_dir.mkdir(parents=True)
-
-                # Create regular files
-                lib_dir = prefix_dir / "lib"
-                lib_dir.mkdir(parents=True, exist_ok=True)
-
-                for i in range(files_per_prefix):
-                    file_path = lib_dir / f"libtest{i}.so"
-                    file_path.write_text(f"Mock library content {i}")
-
-                # Optionally create fat binaries (mock)
-                if include_fat_binaries:
-                    fat_bin = lib_dir / "libfat.so"
-                    fat_bin.write_text("Mock fat binary with device code")
-                    # Mark it for our tests
-                    (lib_dir / ".test_fat_marker").write_text("libfat.so")
-
-                # Optionally create database files
-                if include_db_files:
-                    db_dir = lib_dir / "rocblas" / "library"
-                    db_dir.mkdir(parents=True, exist_ok=True)
-
-                    # Create mock rocBLAS database files
-                    (db_dir / "TensileLibrary_gfx1100.dat").write_text(
-                        "Mock tensor data"
-                    )
-                    (db_dir / "TensileLibrary_gfx1100.co").write_text(
-                        "Mock code object"
-                    )
-                    (db_dir / "kernels.db").write_text("Mock kernel database")
-
+            shutil.copytree(template, artifact_dir, copy_function=os.link)
             return artifact_dir
 
         return _create
@@ -117,7 +210,7 @@ class TestArtifactSplitterIntegration:
         assert (generic_prefix / "lib" / "libtest1.so").exists()
         assert (generic_prefix / "lib" / "libtest2.so").exists()
 
-    def test_artifact_with_fat_binaries(self, test_assets_dir, toolchain, tmp_path):
+    def test_artifact_with_fat_binaries(self, cov5_binaries, toolchain, tmp_path):
         """Test splitting artifact with real fat binaries from test assets."""
         # Create test artifact structure
         input_dir = tmp_path / "test_artifact"
@@ -133,16 +226,14 @@ class TestArtifactSplitterIntegration:
         lib_dir.mkdir(parents=True)
 
         # Copy real fat binary from test assets
-        fat_binary_src = (
-            test_assets_dir / "bundled_binaries/linux/cov5/libtest_kernel_multi.so"
-        )
+        fat_binary_src = cov5_binaries / "libtest_kernel_multi.so"
         fat_binary_dest = lib_dir / "libtest.so"
-        shutil.copy2(fat_binary_src, fat_binary_dest)
+        _link_or_copy(fat_binary_src, fat_binary_dest)
 
         # Also copy a host-only library
-        host_only_src = test_assets_dir / "bundled_binaries/linux/cov5/libhost_only.so"
+        host_only_src = cov5_binaries / "libhost_only.so"
         host_only_dest = lib_dir / "libhost.so"
-        shutil.copy2(host_only_src, host_only_dest)
+        _link_or_copy(host_only_src, host_only_dest)
 
         output_dir = tmp_path / "output"
 
@@ -169,7 +260,7 @@ class TestArtifactSplitterIntegration:
         # Verify fat binary was detected and kernels extracted
         # Should have created architecture-specific artifacts
         # The test binary has gfx1100 and gfx1101 kernels
-        arch_artifacts = list(output_dir.glob("test_lib_gfx*"))
+        arch_artifacts = _scan_arch_artifacts(output_dir, "test_lib")
         assert (
             len(arch_artifacts) >= 1
         ), "Should have created at least one architecture-specific artifact"
@@ -186,8 +277,7 @@ class TestArtifactSplitterIntegration:
         assert manifest_file.exists(), "Manifest file should exist in generic artifact"
 
         # Verify manifest content
-        with open(manifest_file, "rb") as f:
-            manifest_data = msgpack.unpack(f)
+        manifest_data = _read_kpm(manifest_file)
 
         assert manifest_data["format_version"] == 1
         assert manifest_data["component_name"] == "test_lib"
@@ -295,7 +385,31 @@ class TestArtifactSplitterIntegration:
             prefix_dir = generic_dir / prefix
             assert prefix_dir.exists(), f"Missing prefix: {prefix}"
 
-    def test_file_classification_visitor(self, test_assets_dir, toolchain, tmp_path):
+    def test_parallel_prefix_output_not_interleaved(
+        self, create_test_artifact, toolchain, tmp_path, capsys
+    ):
+        """Test that verbose output of concurrent prefixes is printed in blocks."""
+        prefixes = [f"lib{i}/stage" for i in range(4)]
+        input_dir = create_test_artifact(prefixes=prefixes, files_per_prefix=3)
+
+        splitter = ArtifactSplitter(
+            artifact_prefix="multi_lib",
+            toolchain=toolchain,
+            database_handlers=[],
+            verbose=True,
+            max_workers=4,
+        )
+        splitter.split(input_dir, tmp_path / "output")
+
+        # Each prefix's block runs from its header to its copy statistics
+        # without lines from another prefix in between
+        lines = capsys.readouterr().out.splitlines()
+        for prefix in prefixes:
+            start = lines.index(f"Processing prefix: {prefix}")
+            assert lines[start + 1] == f"Scanning prefix: {input_dir / prefix}"
+            assert lines[start + 5] == "  Copied 3 files, excluded 0 files"
+
+    def test_file_classification_visitor(self, cov5_binaries, toolchain, tmp_path):
         """Test the FileClassificationVisitor directly with real files."""
         # Create test directory
         test_dir = tmp_path / "test"
@@ -305,15 +419,13 @@ class TestArtifactSplitterIntegration:
         lib_dir.mkdir()
 
         # Copy real binaries from test assets
-        fat_binary_src = (
-            test_assets_dir / "bundled_binaries/linux/cov5/libtest_kernel_multi.so"
-        )
+        fat_binary_src = cov5_binaries / "libtest_kernel_multi.so"
         fat_binary = lib_dir / "fat.so"
-        shutil.copy2(fat_binary_src, fat_binary)
+        _link_or_copy(fat_binary_src, fat_binary)
 
-        host_only_src = test_assets_dir / "bundled_binaries/linux/cov5/libhost_only.so"
+        host_only_src = cov5_binaries / "libhost_only.so"
         regular_binary = lib_dir / "regular.so"
-        shutil.copy2(host_only_src, regular_binary)
+        _link_or_copy(host_only_src, regular_binary)
 
         # Create rocBLAS database files
         db_dir = lib_dir / "rocblas" / "library"
@@ -339,6 +451,88 @@ class TestArtifactSplitterIntegration:
 
         assert len(visitor.exclude_from_generic) == 1  # Only database file
 
+    def test_file_classification_visitor_batched(self, toolchain, tmp_path):
+        """Test that visit_files classifies like repeated visit_file calls."""
+        db_dir = tmp_path / "lib" / "rocblas" / "library"
+        os.makedirs(db_dir)
+        files = []
+        for i, arch in enumerate(["gfx1100", "gfx942", "gfx1100", "gfx90a"]):
+            path = db_dir / f"TensileLibrary_{arch}_{i}.dat"
+            path.write_text("data")
+            files.append(path)
+        plain = tmp_path / "lib" / "libplain.so"
+        plain.write_text("not an ELF")
+        files.append(plain)
+
+        handlers = [RocBLASHandler()]
+        serial = FileClassificationVisitor(toolchain, handlers)
+        for path in files:
+            serial.visit_file(path, tmp_path)
+
+        batched = FileClassificationVisitor(toolchain, handlers)
+        batched.visit_files(files, tmp_path, max_workers=4)
+
+        assert batched.fat_binaries == serial.fat_binaries
+        assert batched.database_files_by_arch == serial.database_files_by_arch
+        assert batched.exclude_from_generic == serial.exclude_from_generic
+        assert len(batched.database_files_by_arch["gfx1100"]) == 2
+        assert plain not in batched.exclude_from_generic
+
+    def test_process_fat_binaries_architecture_filter(
+        self, toolchain, tmp_path, monkeypatch
+    ):
+        """Test that only requested architectures are unbundled and extracted."""
+        targets = [
+            ("host-x86_64-unknown-linux-gnu-", "host.elf"),
+            ("hipv4-amdgcn-amd-amdhsa--gfx1100", "gfx1100.hsaco"),
+            ("hipv4-amdgcn-amd-amdhsa--gfx942", "gfx942.hsaco"),
+        ]
+        rejected = []
+
+        def fake_unbundle(
+            self, dest_dir=None, delete_on_close=True, target_filter=None
+        ):
+            dest_dir = tmp_path / "unbundled"
+            dest_dir.mkdir(exist_ok=True)
+            target_list = []
+            for target_name, file_name in targets:
+                if target_filter is not None and not target_filter(target_name):
+                    rejected.append(target_name)
+                    continue
+                (dest_dir / file_name).write_bytes(target_name.encode())
+                target_list.append((target_name, file_name))
+            return UnbundledContents(self, dest_dir, delete_on_close, target_list)
+
+        monkeypatch.setattr(
+            BundledBinary, "_detect_binary_type", lambda self: BinaryType.STANDALONE
+        )
+        monkeypatch.setattr(BundledBinary, "unbundle", fake_unbundle)
+
+        prefix_path = tmp_path / "stage"
+        binary_path = prefix_path / "lib" / "libtest.so"
+        binary_path.parent.mkdir(parents=True)
+        binary_path.write_bytes(b"fat binary")
+
+        splitter = ArtifactSplitter(
+            artifact_prefix="test",
+            toolchain=toolchain,
+            database_handlers=[],
+            architectures=["gfx1100"],
+        )
+        kernels_by_arch = splitter.process_fat_binaries(
+            [binary_path], "stage", prefix_path
+        )
+
+        # Neither the host bundle nor unrequested architectures are unbundled
+        assert rejected == [
+            "host-x86_64-unknown-linux-gnu-",
+            "hipv4-amdgcn-amd-amdhsa--gfx942",
+        ]
+        assert list(kernels_by_arch) == ["gfx1100"]
+        (kernel,) = kernels_by_arch["gfx1100"]
+        assert kernel.kernel_data == b"hipv4-amdgcn-amd-amdhsa--gfx1100"
+        assert kernel.source_binary_relpath == "lib/libtest.so"
+
     def test_extracted_kernel_dataclass(self):
         """Test the ExtractedKernel dataclass."""
         kernel = ExtractedKernel(
@@ -496,7 +690,7 @@ class TestArtifactSplitterIntegration:
         assert (arch_db_path / "TensileLibrary_gfx1100.co").exists()
 
     def test_kpack_uses_original_prefix_not_synthetic(
-        self, test_assets_dir, toolchain, tmp_path
+        self, cov5_binaries, toolchain, tmp_path
     ):
         """
         Test that kpack files are placed in original prefix directory, not synthetic kpack/stage.
@@ -521,10 +715,8 @@ class TestArtifactSplitterIntegration:
         lib_dir.mkdir(parents=True)
 
         # Copy real fat binary from test assets
-        fat_binary_src = (
-            test_assets_dir / "bundled_binaries/linux/cov5/libtest_kernel_multi.so"
-        )
-        shutil.copy2(fat_binary_src, lib_dir / "librocrand.so")
+        fat_binary_src = cov5_binaries / "libtest_kernel_multi.so"
+        _link_or_copy(fat_binary_src, lib_dir / "librocrand.so")
 
         output_dir = tmp_path / "output"
 
@@ -538,7 +730,7 @@ class TestArtifactSplitterIntegration:
         splitter.split(input_dir, output_dir)
 
         # Find arch-specific artifacts
-        arch_artifacts = list(output_dir.glob("rand_lib_gfx*"))
+        arch_artifacts = _scan_arch_artifacts(output_dir, "rand_lib")
         assert (
             len(arch_artifacts) >= 1
         ), "Should have at least one arch-specific artifact"
@@ -673,7 +865,7 @@ class TestArtifactSplitterIntegration:
         assert (generic_lib_dir / "librocrand.so").resolve().name == "librocrand.so.1.1"
 
     def test_overlay_produces_merged_kpack_directory(
-        self, test_assets_dir, toolchain, tmp_path
+        self, cov5_binaries, toolchain, tmp_path
     ):
         """
         Test that extracting generic + arch artifacts to same location merges correctly.
@@ -693,10 +885,8 @@ class TestArtifactSplitterIntegration:
         lib_dir.mkdir(parents=True)
 
         # Copy real fat binary
-        fat_binary_src = (
-            test_assets_dir / "bundled_binaries/linux/cov5/libtest_kernel_multi.so"
-        )
-        shutil.copy2(fat_binary_src, lib_dir / "librocrand.so")
+        fat_binary_src = cov5_binaries / "libtest_kernel_multi.so"
+        _link_or_copy(fat_binary_src, lib_dir / "librocrand.so")
 
         output_dir = tmp_path / "output"
 
@@ -715,12 +905,24 @@ class TestArtifactSplitterIntegration:
 
         # Extract generic first
         generic_dir = output_dir / "rand_lib_generic"
-        shutil.copytree(generic_dir, overlay_dir, dirs_exist_ok=True)
+        shutil.copytree(
+            generic_dir,
+            overlay_dir,
+            symlinks=True,
+            dirs_exist_ok=True,
+            copy_function=_link_or_copy,
+        )
 
         # Extract arch-specific on top (should merge .kpack directory)
-        arch_artifacts = list(output_dir.glob("rand_lib_gfx*"))
+        arch_artifacts = _scan_arch_artifacts(output_dir, "rand_lib")
         for arch_artifact in arch_artifacts:
-            shutil.copytree(arch_artifact, overlay_dir, dirs_exist_ok=True)
+            shutil.copytree(
+                arch_artifact,
+                overlay_dir,
+                symlinks=True,
+                dirs_exist_ok=True,
+                copy_function=_link_or_copy,
+            )
 
         # Verify .kpack directory has both .kpm and .kpack files
         kpack_dir = overlay_dir / prefix / ".kpack"
@@ -738,8 +940,7 @@ class TestArtifactSplitterIntegration:
 
         # Verify the manifest references the kpack files
         manifest_path = kpm_files[0]
-        with open(manifest_path, "rb") as f:
-            manifest_data = msgpack.unpack(f)
+        manifest_data = _read_kpm(manifest_path)
 
         # Manifest should list the architectures
         assert "kpack_files" in manifest_data
@@ -6,6 +6,7 @@ handling, directory traversal, and file classification.
 """
 
 import os
+import struct
 import subprocess
 import tempfile
 from pathlib import Path
@@ -66,6 +67,14 @@ class TestArtifactManifest:
         assert manifest_path.exists()
         assert manifest_path.read_text() == ""
 
+    def test_write_manifest_cleans_up_on_failure(self, tmp_path):
+        """Test that a failed write leaves no temp file behind."""
+        with patch("os.replace", side_effect=OSError("rename failed")):
+            with pytest.raises(OSError, match="rename failed"):
+                write_artifact_manifest(tmp_path, ["kpack/stage"])
+
+        assert list(tmp_path.iterdir()) == []
+
     def test_roundtrip_manifest(self, tmp_path):
         """Test reading and writing manifest preserves data."""
         original_prefixes = [
@@ -137,13 +146,13 @@ class TestScanDirectory:
 
         # Define predicate for .txt files only
         def txt_only(path, entry):
-            return path.suffix == ".txt" or entry.is_dir()
+            return path.suffix == ".txt" or entry.is_dir(follow_symlinks=False)
 
         # Scan with predicate
         results = list(scan_directory(tmp_path, predicate=txt_only))
 
         # Check we only got .txt files
-        file_paths = [p for p, e in results if e.is_file()]
+        file_paths = [p for p, e in results if e.is_file(follow_symlinks=False)]
         assert len(file_paths) == 2
         assert all(p.suffix == ".txt" for p in file_paths)
 
@@ -182,19 +191,75 @@ class TestScanDirectory:
         assert results == []
 
 
+def _make_elf64(section_names: list[str]) -> bytes:
+    """Build a minimal ELF64 little-endian file with the given section names."""
+    strtab = b"\0"
+    name_offsets = []
+    for name in [".shstrtab", *section_names]:
+        name_offsets.append(len(strtab))
+        strtab += name.encode() + b"\0"
+
+    shoff = 64 + len(strtab)
+    shnum = len(name_offsets) + 1  # Plus the NULL section
+    ident = b"\x7fELF" + bytes([2, 1, 1]) + b"\0" * 9
+    ehdr = ident + struct.pack(
+        "<HHIQQQIHHHHHH", 3, 62, 1, 0, 0, shoff, 0, 64, 56, 0, 64, shnum, 1
+    )
+    shdrs = b"\0" * 64
+    for name_offset in name_offsets:
+        shdrs += struct.pack(
+            "<IIQQQQIIQQ", name_offset, 3, 0, 0, 64, len(strtab), 0, 0, 1, 0
+        )
+    return ehdr + strtab + shdrs
+
+
 class TestIsFatBinary:
     """Tests for fat binary detection."""
 
+    def test_is_fat_binary_parses_elf64_in_process(self, tmp_path):
+        """Test that ELF64 files are classified without running readelf."""
+        fat = tmp_path / "fat.so"
+        fat.write_bytes(_make_elf64([".text", ".hip_fatbin", ".data"]))
+        host = tmp_path / "host.so"
+        host.write_bytes(_make_elf64([".text", ".hip_fatbin_extra"]))
+
+        mock_toolchain = Mock(spec=Toolchain)
+        mock_toolchain.readelf = "/usr/bin/readelf"
+
+        with patch("subprocess.check_output") as mock_check:
+            assert is_fat_binary(fat, mock_toolchain) is True
+            assert is_fat_binary(host, mock_toolchain) is False
+            mock_check.assert_not_called()
+
     def test_is_fat_binary_with_hip_fatbin(self, tmp_path):
         """Test detecting a binary with .hip_fatbin section."""
-        # Create a real file with ELF magic bytes
+        elf_file = tmp_path / "binary.so"
+        elf_file.write_bytes(_make_elf64([".text", ".hip_fatbin", ".data"]))
+
+        mock_toolchain = Mock(spec=Toolchain)
+        mock_toolchain.readelf = "/usr/bin/readelf"
+
+        assert is_fat_binary(elf_file, mock_toolchain) is True
+
+    def test_is_fat_binary_without_hip_fatbin(self, tmp_path):
+        """Test detecting a regular binary without .hip_fatbin."""
+        elf_file = tmp_path / "binary.so"
+        elf_file.write_bytes(_make_elf64([".text", ".data"]))
+
+        mock_toolchain = Mock(spec=Toolchain)
+        mock_toolchain.readelf = "/usr/bin/readelf"
+
+        assert is_fat_binary(elf_file, mock_toolchain) is False
+
+    def test_is_fat_binary_falls_back_to_readelf(self, tmp_path):
+        """Test that ELF files the probe cannot parse are checked with readelf."""
+        # ELF magic with no valid header behind it
         elf_file = tmp_path / "binary.so"
         elf_file.write_bytes(b"\x7fELF" + b"\x00" * 100)  # ELF magic + padding
 
         mock_toolchain = Mock(spec=Toolchain)
         mock_toolchain.readelf = "/usr/bin/readelf"
 
-        # Mock subprocess to return output with .hip_fatbin
         with patch("subprocess.check_output") as mock_check:
             mock_check.return_value = """
                 Section Headers:
@@ -207,10 +272,10 @@ class TestIsFatBinary:
 
             result = is_fat_binary(elf_file, mock_toolchain)
             assert result is True
+            mock_check.assert_called_once()
 
-    def test_is_fat_binary_without_hip_fatbin(self, tmp_path):
-        """Test detecting a regular binary without .hip_fatbin."""
-        # Create a real file with ELF magic bytes
+    def test_is_fat_binary_readelf_fallback_without_hip_fatbin(self, tmp_path):
+        """Test that the readelf fallback matches section names exactly."""
         elf_file = tmp_path / "binary.so"
         elf_file.write_bytes(b"\x7fELF" + b"\x00" * 100)  # ELF magic + padding
 
@@ -223,11 +288,13 @@ class TestIsFatBinary:
                   [Nr] Name              Type
                   [ 0]                   NULL
                   [ 1] .text             PROGBITS
-                  [ 2] .data             PROGBITS
+                  [ 2] .hip_fatbin_extra PROGBITS
+                  [ 3] .data             PROGBITS
             """
 
             result = is_fat_binary(elf_file, mock_toolchain)
             assert result is False
+            mock_check.assert_called_once()
 
     def test_is_fat_binary_not_elf(self, tmp_path):
         """Test handling non-ELF files."""
@@ -2,7 +2,15 @@ import shutil
 import subprocess
 from pathlib import Path
 
+import pytest
+
 from rocm_kpack import binutils
+from rocm_kpack.elf_modify_load import (
+    SHF_ALLOC,
+    get_section_name,
+    read_elf_header,
+    read_section_header,
+)
 
 
 def test_toolchain(test_assets_dir: Path, toolchain: binutils.Toolchain):
@@ -19,6 +27,35 @@ def test_toolchain(test_assets_dir: Path, toolchain: binutils.Toolchain):
             raise AssertionError("No target hsaco file")
 
 
+def test_toolchain_finds_tool_installed_later(tmp_path: Path, monkeypatch):
+    """A tool missing on first lookup is found once it appears on PATH."""
+    monkeypatch.setenv("PATH", str(tmp_path))
+    with pytest.raises(OSError, match="Could not file tool"):
+        binutils.Toolchain().readelf
+
+    tool = tmp_path / "readelf"
+    tool.write_text("#!/bin/sh\n")
+    tool.chmod(0o755)
+    assert binutils.Toolchain().readelf == tool
+
+
+def test_unbundle_target_filter(test_assets_dir: Path, toolchain: binutils.Toolchain):
+    """Test that unbundle only extracts targets accepted by target_filter."""
+    bb = binutils.BundledBinary(
+        test_assets_dir / "bundled_binaries/linux/cov5/libtest_kernel_multi.so",
+        toolchain=toolchain,
+    )
+    arch = bb.list_bundles()[0]
+    with bb.unbundle(target_filter=lambda t: t.endswith(f"--{arch}")) as contents:
+        assert contents.target_list
+        for target, filename in contents.target_list:
+            assert target.endswith(f"--{arch}")
+            assert (contents.dest_dir / filename).exists()
+        assert sorted(p.name for p in contents.dest_dir.iterdir()) == sorted(
+            contents.file_names
+        )
+
+
 def test_kpack_ref_marker_roundtrip(
     tmp_path: Path, toolchain: binutils.Toolchain, test_assets_dir: Path
 ):
@@ -241,3 +278,61 @@ def test_kpack_ref_marker_overwrite_output(
     marker_data = binutils.read_kpack_ref_marker(test_binary, toolchain=toolchain)
     assert marker_data is not None
     assert marker_data["kernel_name"] == "bin/test"
+
+
+@pytest.fixture
+def sections_binary(tmp_path: Path) -> Path:
+    """An executable with two allocated sections, one named as a prefix of the other."""
+    if shutil.which("gcc") is None:
+        pytest.skip("gcc not available")
+    source = tmp_path / "sections.c"
+    source.write_text(
+        '__attribute__((section(".kpack_test"), used)) static const char a[] = "a";\n'
+        '__attribute__((section(".kpack_test2"), used)) static const char b[] = "b";\n'
+        "int main(void) { return 0; }\n"
+    )
+    binary = tmp_path / "sections"
+    subprocess.run(["gcc", str(source), "-o", str(binary)], check=True)
+    return binary
+
+
+def _section_headers(binary: Path):
+    """(name, section header) for each named section, parsed in-process."""
+    data = binary.read_bytes()
+    ehdr = read_elf_header(data)
+    strtab = read_section_header(data, ehdr.e_shoff + ehdr.e_shstrndx * 64)
+    for i in range(1, ehdr.e_shnum):
+        shdr = read_section_header(data, ehdr.e_shoff + i * 64)
+        yield get_section_name(data, strtab.sh_offset, shdr.sh_name), shdr
+
+
+def test_get_section_vaddr_matches_section_headers(
+    sections_binary: Path, toolchain: binutils.Toolchain
+):
+    """get_section_vaddr agrees with sh_addr for every section."""
+    for name, shdr in _section_headers(sections_binary):
+        expected = shdr.sh_addr if shdr.sh_flags & SHF_ALLOC else None
+        assert (
+            binutils.get_section_vaddr(toolchain, sections_binary, name) == expected
+        ), f"Wrong address for {name}"
+
+    # Names are matched exactly, not as prefixes or substrings
+    assert binutils.get_section_vaddr(toolchain, sections_binary, ".kpack_tes") is None
+
+
+def test_get_section_types_matches_section_headers(
+    sections_binary: Path, toolchain: binutils.Toolchain
+):
+    """get_section_types reports every named section with its sh_type."""
+    type_names = {1: "PROGBITS", 8: "NOBITS"}
+
+    section_types = binutils.get_section_types(sections_binary, toolchain=toolchain)
+
+    names = set()
+    for name, shdr in _section_headers(sections_binary):
+        names.add(name)
+        if shdr.sh_type in type_names:
+            assert section_types[name] == type_names[shdr.sh_type], name
+    assert set(section_types) == names
+    assert section_types[".kpack_test"] == "PROGBITS"
+    assert section_types[".kpack_test2"] == "PROGBITS"
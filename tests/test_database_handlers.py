@@ -1,5 +1,6 @@
 """Unit tests for database handlers."""
 
+import fnmatch
 from pathlib import Path
 
 import pytest
@@ -8,6 +9,7 @@ from rocm_kpack.database_handlers import (
     RocBLASHandler,
     HipBLASLtHandler,
     AotritonHandler,
+    DatabaseHandler,
     get_database_handlers,
     list_available_handlers,
 )
@@ -313,6 +315,55 @@ class TestAotritonHandler:
         assert result == "gfx1100"
 
 
+class TestPathPatterns:
+    """Tests that handler path patterns cover everything detect() accepts."""
+
+    @pytest.mark.parametrize(
+        "handler,detected,rejected",
+        [
+            (
+                RocBLASHandler(),
+                "lib/rocblas/library/TensileLibrary_gfx1100.co",
+                "lib/rocblas/library/TensileLibrary.yaml",
+            ),
+            (
+                HipBLASLtHandler(),
+                "lib/hipblaslt/library/kernel_gfx942.hsaco",
+                "lib/hipblaslt/other/kernel_gfx942.hsaco",
+            ),
+            (
+                AotritonHandler(),
+                "lib/aotriton/kernels/gfx1100/subdir/kernel.hsaco",
+                "lib/aotriton/kernels/common/kernel.hsaco",
+            ),
+            (
+                AotritonHandler(),
+                "lib/aotriton/kernels/gfx942.aks2",
+                "lib/aotriton/kernels/common.aks2",
+            ),
+        ],
+    )
+    def test_patterns_cover_detected_paths(self, handler, detected, rejected, tmp_path):
+        """Detected paths match a pattern; unrelated paths can be skipped."""
+        patterns = handler.path_patterns()
+        assert handler.detect(tmp_path / detected, tmp_path) is not None
+        assert any(fnmatch.fnmatchcase(detected, p) for p in patterns)
+        assert not any(fnmatch.fnmatchcase(rejected, p) for p in patterns)
+
+    def test_default_patterns_match_everything(self):
+        """Handlers without explicit patterns see every file."""
+
+        class CustomHandler(DatabaseHandler):
+            def name(self):
+                return "custom"
+
+            def detect(self, path, prefix_root):
+                return None
+
+        patterns = CustomHandler().path_patterns()
+        assert any(fnmatch.fnmatchcase("any/file.bin", p) for p in patterns)
+
+
 class TestDatabaseHandlerRegistry:
     """Tests for database handler registry functions."""
 